@@ -10,41 +10,251 @@ import json
 import os
 import sys
 import argparse
+import functools
+import math
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, List, Tuple, Union, Optional
+from urllib.parse import unquote, urldefrag, urljoin, urlparse
+from urllib.request import url2pathname, urlopen
 
-# Optional dependency with fallback
+# Optional dependencies with fallback
 try:
-    import jsonref
+    import orjson
 except ImportError:
-    print("Warning: jsonref library not found. Install with: pip install jsonref")
-    jsonref = None
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Keywords whose value maps names to subschemas that get the property transforms
+_SUBSCHEMA_MAP_KEYWORDS = frozenset({"properties", "definitions", "$defs"})
+
+# Keywords whose value is a subschema, or a list of subschemas, that gets the
+# property transforms
+_SUBSCHEMA_KEYWORDS = frozenset({"items", "allOf", "anyOf", "oneOf"})
+
+# Node kinds tracked by SchemaBundler._walk_and_transform. Plain nodes have their
+# references resolved but are never transformed: besides instance data such as
+# default/enum, this covers not, if/then/else, contains, propertyNames and vendor
+# keywords, where an added "required" would change what the schema means.
+_SCHEMA_NODE, _SUBSCHEMA_MAP_NODE, _PLAIN_NODE = range(3)
+
+# Kind of a schema's child by keyword; any other keyword holds a plain node
+_SCHEMA_CHILD_KINDS = {
+    **{keyword: _SUBSCHEMA_MAP_NODE for keyword in _SUBSCHEMA_MAP_KEYWORDS},
+    **{keyword: _SCHEMA_NODE for keyword in _SUBSCHEMA_KEYWORDS},
+}
+
+# A run of 19 digits is the shortest integer orjson may silently turn into a float
+# (beyond the signed 64-bit range). Bytes are searched after mapping every digit
+# to "0" and everything else to " ", which is far faster than a regex; a match
+# inside a string only costs a slower but exact parse.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
+
+# Floats from 1e-9 up to 1e-4 are the only ones orjson spells differently
+# from json.dump ("1e-7" and "0.00001" against "1e-07" and "1e-05"). The two
+# forms are searched separately so each search can scan for a literal.
+_ORJSON_SHORT_EXPONENT = re.compile(rb"e-\d(?!\d)")
+_ORJSON_SMALL_DECIMAL = b"0.0000"
+
+
+def _orjson_float_differs(data: bytes) -> bool:
+    """Check whether orjson output may spell a float differently from json"""
+    return _ORJSON_SMALL_DECIMAL in data or _ORJSON_SHORT_EXPONENT.search(data) is not None
+
+
+# Stack markers for finishing a schema once all of its children are resolved,
+# and for recording a finished $ref expansion for reuse
+_FINALIZE = object()
+_MEMOIZE = object()
+
+
+class _AllPropertiesRequired:
+    """Placeholder for a required list naming every key of a properties dict"""
+    
+    __slots__ = ("properties",)
+    
+    def __init__(self, properties: Dict[str, Any]):
+        self.properties = properties
+
+
+def _json_default(obj: Any) -> Any:
+    """Serializer hook expanding _AllPropertiesRequired placeholders into lists"""
+    if isinstance(obj, _AllPropertiesRequired):
+        return list(obj.properties)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _NonFiniteFloat(float):
+    """
+    NaN or infinity read by the standard library parser.
+    
+    orjson would write these as null; it rejects float subclasses instead, so
+    _json_dumps falls back to json.dumps, which writes them as the input did.
+    """
+    
+    __slots__ = ()
+
+
+def _parse_float(text: str) -> float:
+    """parse_float hook marking literals such as 1e400 that overflow to infinity"""
+    value = float(text)
+    return value if math.isfinite(value) else _NonFiniteFloat(value)
+
+
+def _stdlib_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with the standard library, keeping every number exact"""
+    if orjson is None:
+        # json.dumps writes the same values back, no marking needed
+        return json.loads(data)
+    return json.loads(data, parse_constant=_NonFiniteFloat, parse_float=_parse_float)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when it represents the document exactly.
+    
+    orjson turns integers beyond 64 bits into floats and rejects NaN and
+    Infinity; such documents go to the standard library parser instead,
+    which also reports the error for really invalid JSON.
+    """
+    if orjson is not None:
+        raw = data if isinstance(data, bytes) else data.encode("utf-8", "surrogatepass")
+        if _LONG_DIGIT_RUN not in raw.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return _stdlib_loads(data)
+
+
+def _json_dumps(schema: Any) -> bytes:
+    """
+    Serialize a bundled schema to UTF-8 JSON indented by 2 spaces.
+    
+    orjson is used when available; values it cannot write exactly (integers
+    beyond 64 bits, NaN and infinities) make it raise, and the standard
+    library writes the schema instead. So does output that may hold a float
+    orjson formats differently from json.dump, keeping the output unchanged.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(schema, default=_json_default, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            data = None
+        if data is not None and not _orjson_float_differs(data):
+            return data
+    return json.dumps(schema, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_ref(base_uri: str, ref: str) -> Tuple[str, str, str]:
+    """
+    Resolve a $ref against its document URI, memoized since schemas repeat refs.
+    
+    Args:
+        base_uri: URI of the document containing the reference
+        ref: Value of the $ref keyword
+        
+    Returns:
+        Tuple of (absolute URI, document URI, fragment)
+    """
+    uri = urljoin(base_uri, ref)
+    doc_uri, fragment = urldefrag(uri)
+    return uri, doc_uri, fragment
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_pointer(fragment: str) -> Tuple[str, ...]:
+    """
+    Split a JSON pointer fragment into unescaped reference tokens (RFC 6901).
+    
+    Args:
+        fragment: URI fragment without the leading '#', possibly percent-encoded
+        
+    Returns:
+        Tuple of reference tokens, empty for the whole document
+    """
+    return tuple(
+        token.replace("~1", "/").replace("~0", "~")
+        for token in unquote(fragment).split("/")[1:]
+    )
+
+
+def _scope_uri(base_uri: str, node: Dict[str, Any]) -> str:
+    """
+    Return the base URI in effect inside a schema object.
+    
+    Like jsonref with jsonschema=True, a string "$id" (or draft-04 "id")
+    is resolved against the enclosing base URI; the fragment is dropped.
+    
+    Args:
+        base_uri: Base URI of the enclosing scope
+        node: Schema object that may declare its own identifier
+        
+    Returns:
+        Base URI for the node's own references and children
+    """
+    id_ = node.get("$id") or node.get("id")
+    if isinstance(id_, str):
+        return _join_ref(base_uri, id_)[1]
+    return base_uri
+
+
+def _scan_document(
+    document: Any, base_uri: str, embedded: Dict[str, Tuple[Any, str]]
+) -> List[Tuple[str, str]]:
+    """
+    Collect the references of a parsed JSON document and its identified subschemas.
+    
+    Args:
+        document: Parsed JSON document
+        base_uri: URI the document was loaded from
+        embedded: Receives {absolute $id URI: (subschema, enclosing base URI)}
+            for every subschema that declares its own identifier
+        
+    Returns:
+        List of (base URI, $ref) pairs, one per reference in the document
+    """
+    refs = []
+    stack = [(document, base_uri)]
+    while stack:
+        node, base = stack.pop()
+        if isinstance(node, dict):
+            scope = _scope_uri(base, node)
+            if scope != base:
+                embedded.setdefault(scope, (node, base))
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                refs.append((scope, ref))
+            stack.extend((value, scope) for value in node.values())
+        elif isinstance(node, list):
+            stack.extend((value, base) for value in node)
+    return refs
 
 
 class SchemaBundler:
     """JSON Schema bundler with reference resolution"""
     
+    __slots__ = ("base_path", "_abs_base", "base_uri", "_ref_cache", "_embedded", "_ref_sources")
+    
     def __init__(self, base_path: Optional[str] = None):
         """Initialize the bundler with optional base path"""
         self.base_path = Path(base_path) if base_path else Path.cwd()
-        self.base_uri = f"file://{self.base_path.absolute()}/"
-    
-    def to_plain(self, obj: Any) -> Any:
-        """
-        Recursively clean JsonRef or other non-serializable objects into normal dicts and lists.
-        
-        Args:
-            obj: Object to clean (dict, list, or primitive)
-            
-        Returns:
-            Cleaned object with resolved references
-        """
-        if isinstance(obj, dict):
-            return {k: self.to_plain(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self.to_plain(v) for v in obj]
-        else:
-            return obj
+        self._abs_base = str(self.base_path.absolute())
+        self.base_uri = f"file://{self._abs_base}/"
+        self._ref_cache: Dict[str, Any] = {}  # Referenced documents by absolute URI
+        # $id-identified subschemas of referenced documents: (node, enclosing base URI)
+        self._embedded: Dict[str, Tuple[Any, str]] = {}
+        # (path, mtime_ns) of each referenced document read from a local file, by URI
+        self._ref_sources: Dict[str, Tuple[str, int]] = {}
     
     def load_schema(self, schema_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -62,39 +272,347 @@ class SchemaBundler:
         """
         schema_file = Path(schema_path)
         
-        if not schema_file.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_file}")
-        
+        # Open directly instead of checking existence first: one syscall instead of two
         try:
-            with open(schema_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                return json.loads(content)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in {schema_file}: {e.msg}", e.doc, e.pos)
+            f = open(schema_file, "rb", buffering=0)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Schema file not found: {schema_file}") from e
+        
+        with f:
+            # Without orjson, stream-parse with ijson so the raw text is never held in memory
+            if orjson is None and ijson is not None:
+                try:
+                    values = ijson.items(f, "", use_float=True)
+                    document = next(values)
+                    # Asking for another value makes ijson parse the rest of the file,
+                    # so trailing data is rejected instead of silently ignored
+                    for _ in values:
+                        raise ijson.JSONError("Extra data after the top-level JSON value")
+                    return document
+                except ijson.JSONError:
+                    # Out-of-range numbers and NaN/Infinity are only accepted by
+                    # json.loads, which also reports really invalid JSON
+                    f.seek(0)
+            
+            try:
+                # orjson parses the whole buffer in one fast C pass when it can; json.loads
+                # detects UTF-8/16/32 (with or without BOM) from bytes itself
+                return _json_loads(f.read())
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"Invalid JSON in {schema_file}: {e.msg}", e.doc, e.pos)
     
-    def resolve_references(self, schema_content: str) -> Dict[str, Any]:
+    def resolve_references(self, schema_content: Union[str, bytes]) -> Dict[str, Any]:
         """
-        Resolve JSON schema references using jsonref library.
+        Resolve JSON schema references.
         
         Args:
-            schema_content: Raw JSON schema content as string
+            schema_content: Raw JSON schema content as string or bytes
             
         Returns:
             Resolved schema dictionary
             
         Raises:
-            ImportError: If jsonref library is not available
             Exception: If reference resolution fails
         """
-        if jsonref is None:
-            raise ImportError("jsonref library is required for reference resolution")
+        return self.resolve_schema(_json_loads(schema_content))
+    
+    def resolve_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve JSON schema references in an already parsed schema.
         
+        Args:
+            schema: Parsed JSON schema
+            
+        Returns:
+            Resolved schema dictionary
+            
+        Raises:
+            Exception: If reference resolution fails
+        """
         try:
-            resolved = jsonref.loads(schema_content, base_uri=self.base_uri, jsonschema=True)
-            return self.to_plain(resolved)
+            return self._walk_and_transform(schema, flatten=False, set_required=False)
         except Exception as e:
             raise Exception(f"Failed to resolve schema references: {str(e)}")
     
+    def _load_ref_doc(self, abs_uri: str) -> Any:
+        """
+        Load a referenced document, reading each absolute URI at most once.
+        
+        Args:
+            abs_uri: Absolute document URI without fragment
+            
+        Returns:
+            Parsed JSON document
+        """
+        try:
+            return self._ref_cache[abs_uri]
+        except KeyError:
+            document = self._fetch_ref_doc(abs_uri)
+            self._register_ref_doc(abs_uri, document)
+            return document
+    
+    def _register_ref_doc(self, abs_uri: str, document: Any) -> List[Tuple[str, str]]:
+        """
+        Cache a loaded document and index the subschemas it identifies with $id.
+        
+        Returns:
+            The document's (base URI, $ref) pairs, see _scan_document
+        """
+        self._ref_cache[abs_uri] = document
+        return _scan_document(document, abs_uri, self._embedded)
+    
+    def _fetch_ref_doc(self, abs_uri: str) -> Any:
+        """Read and parse the document at an absolute URI, bypassing the cache"""
+        parsed = urlparse(abs_uri)
+        if parsed.scheme == "file":
+            path = url2pathname(parsed.path)
+            # Stat before reading, so a concurrent edit can only make the stamp older
+            mtime_ns = os.stat(path).st_mtime_ns
+            document = _json_loads(Path(path).read_bytes())
+            self._ref_sources[abs_uri] = (path, mtime_ns)
+            return document
+        with urlopen(abs_uri) as response:
+            return _json_loads(response.read())
+    
+    def _source_stamps(self) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """
+        Identify the referenced documents read so far by path and modification time.
+        
+        Returns:
+            Tuple of (path, mtime_ns) pairs, or None if a document came from a
+            URL whose freshness can't be checked
+        """
+        try:
+            return tuple(self._ref_sources[uri] for uri in self._ref_cache)
+        except KeyError:
+            return None
+    
+    def _prefetch_ref_docs(
+        self, schema: Dict[str, Any], root_embedded: Dict[str, Tuple[Any, str]]
+    ) -> None:
+        """
+        Read the local files the root schema refers to concurrently into the cache.
+        
+        Only the root is scanned and only file: targets are read; documents
+        those files refer to, and anything remote, are left to the walk, so
+        nothing the bundle doesn't reach is fetched. Failures are ignored
+        here; a document that is really needed raises when the walk loads it.
+        
+        Args:
+            schema: Root schema, identified by self.base_uri
+            root_embedded: Receives the root schema's $id-identified subschemas
+        """
+        # Targets are collected only after the whole root has been scanned,
+        # so a reference to an $id declared further down is not read
+        wanted = set()
+        for base_uri, ref in _scan_document(schema, self.base_uri, root_embedded):
+            target = _join_ref(base_uri, ref)[1]
+            if (
+                target.startswith("file:")
+                and target != self.base_uri
+                and target not in root_embedded
+                and target not in self._ref_cache
+                and target not in self._embedded
+            ):
+                wanted.add(target)
+        # A single document gains nothing from a pool; the walk reads it
+        if len(wanted) <= 1:
+            return
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(wanted))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {uri: pool.submit(self._fetch_ref_doc, uri) for uri in wanted}
+        for uri, future in futures.items():
+            if future.exception() is None:
+                self._register_ref_doc(uri, future.result())
+    
+    def _deref_pointer(self, document: Any, fragment: str, base_uri: str) -> Tuple[Any, str]:
+        """
+        Evaluate a JSON pointer fragment (RFC 6901) against a document.
+        
+        Args:
+            document: Document to evaluate the pointer against
+            fragment: Pointer fragment without the leading '#'
+            base_uri: Base URI in effect around the document
+            
+        Returns:
+            Tuple of (referenced node, base URI in effect around it), taking
+            the $id of every schema object passed on the way into account
+            
+        Raises:
+            KeyError: If the pointer does not exist in the document
+        """
+        node = document
+        for token in _parse_pointer(fragment):
+            if isinstance(node, list):
+                node = node[int(token)]
+            else:
+                base_uri = _scope_uri(base_uri, node)
+                node = node[token]
+        return node, base_uri
+    
+    def _walk_and_transform(
+        self,
+        schema: Dict[str, Any],
+        flatten: bool,
+        set_required: bool,
+        lazy_required: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Resolve references and apply the property transformations in one walk.
+        
+        Every {"$ref": ...} object is replaced by a plain copy of its target.
+        The root schema and the subschemas reached from it through property
+        values, items, allOf/anyOf/oneOf and definitions/$defs are passed
+        through _finalize_properties once their children are done; the values
+        of any other keyword are resolved but left as they are. The walk uses
+        an explicit stack, so deep schemas cannot hit the recursion limit.
+        
+        References are resolved against the base URI in effect at their
+        position, which "$id" (or "id") keywords change as in jsonref with
+        jsonschema=True. A recursive reference cannot be expanded and is kept
+        as a reference, rewritten to "#<pointer>" when it targets the root
+        schema and to its absolute URI otherwise, so it still resolves from
+        the bundled output.
+        
+        Each finished expansion of a reference is memoized and shared by later
+        occurrences of the same reference, so a target is walked only once.
+        Expansions in which a recursive reference had to be cut depend on
+        their ancestors and are not memoized.
+        
+        Args:
+            schema: Parsed JSON schema
+            flatten: Whether to flatten nested properties
+            set_required: Whether to set all properties as required
+            lazy_required: Whether required lists are left for _json_default
+                to build at serialization time
+            
+        Returns:
+            New schema dictionary made of plain dicts and lists
+        """
+        # Root subschemas identified by $id, kept out of the bundler-wide index
+        # since they belong to this schema only
+        root_embedded: Dict[str, Tuple[Any, str]] = {}
+        self._prefetch_ref_docs(schema, root_embedded)
+        
+        transform = flatten or set_required
+        # Local bindings keep attribute and global lookups out of the per-node loop
+        intern = sys.intern
+        containers = (dict, list)
+        schema_child_kind = _SCHEMA_CHILD_KINDS.get
+        finalize = self._finalize_properties
+        join_ref = _join_ref
+        scope_uri = _scope_uri
+        deref = self._deref_pointer
+        embedded = self._embedded
+        root_uri = self.base_uri
+        
+        def load_document(doc_uri: str) -> Tuple[Any, str]:
+            """Document or identified subschema at doc_uri, with its enclosing base URI"""
+            if doc_uri == root_uri:
+                return schema, root_uri
+            if doc_uri in root_embedded:
+                return root_embedded[doc_uri]
+            if doc_uri in embedded:
+                return embedded[doc_uri]
+            return self._load_ref_doc(doc_uri), doc_uri
+        
+        memo: Dict[Tuple[str, int], Any] = {}  # Finished expansions by (ref URI, node kind)
+        open_expansions = []  # [memoizable] flags of expansions still being walked
+        result = [None]
+        # Entries: (node, base URI, refs being expanded, parent container, key, node kind)
+        stack = [(schema, root_uri, frozenset(), result, 0, _SCHEMA_NODE)]
+        push = stack.append
+        pop = stack.pop
+        
+        while stack:
+            entry = pop()
+            if entry[0] is _FINALIZE:
+                finalize(entry[1], flatten, set_required, lazy_required)
+                continue
+            if entry[0] is _MEMOIZE:
+                memoizable = open_expansions.pop()
+                if memoizable[0]:
+                    for memo_key in entry[1]:
+                        memo[memo_key] = entry[2]
+                continue
+            
+            node, base_uri, resolving, parent, key, kind = entry
+            
+            # Follow reference chains down to a concrete node
+            memo_keys = []
+            shared = False
+            while isinstance(node, dict) and "$ref" in node and isinstance(node["$ref"], str):
+                uri, doc_uri, fragment = join_ref(scope_uri(base_uri, node), node["$ref"])
+                if uri in resolving:
+                    # Recursive reference: keep it as a reference instead of expanding
+                    # forever, spelled so that it resolves from the bundled output
+                    target_ref = "#" + fragment if load_document(doc_uri)[0] is schema else uri
+                    if node["$ref"] != target_ref:
+                        node = dict(node)
+                        node["$ref"] = target_ref
+                    # The enclosing expansions now depend on where they were reached from,
+                    # and so do the hops of this chain leading up to the cut
+                    for memoizable in open_expansions:
+                        memoizable[0] = False
+                    memo_keys = []
+                    break
+                memo_key = (uri, kind)
+                if memo_key in memo:
+                    node = memo[memo_key]
+                    shared = True
+                    break
+                memo_keys.append(memo_key)
+                document, document_base = load_document(doc_uri)
+                node, base_uri = deref(document, fragment, document_base)
+                resolving = resolving | {uri}
+            
+            if shared:
+                # Already walked elsewhere: share the finished copy
+                for hop_key in memo_keys:
+                    memo[hop_key] = node
+                parent[key] = node
+                continue
+            
+            if isinstance(node, dict):
+                base_uri = scope_uri(base_uri, node)
+                copied = {}
+                if memo_keys:
+                    # Pushed first, so it runs after the finalize step and all children
+                    open_expansions.append([True])
+                    push((_MEMOIZE, memo_keys, copied))
+                if transform and kind == _SCHEMA_NODE and isinstance(node.get("properties"), dict):
+                    # Pushed before the children, so it runs after all of them
+                    push((_FINALIZE, copied))
+                for k, v in node.items():
+                    # Interned keys let repeated property names share one string object
+                    k = intern(k)
+                    copied[k] = v
+                    if isinstance(v, containers):
+                        if kind == _SCHEMA_NODE:
+                            child_kind = schema_child_kind(k, _PLAIN_NODE)
+                        elif kind == _SUBSCHEMA_MAP_NODE:
+                            child_kind = _SCHEMA_NODE
+                        else:
+                            child_kind = _PLAIN_NODE
+                        push((v, base_uri, resolving, copied, k, child_kind))
+            elif isinstance(node, list):
+                copied = list(node)
+                if memo_keys:
+                    open_expansions.append([True])
+                    push((_MEMOIZE, memo_keys, copied))
+                for i, v in enumerate(node):
+                    if isinstance(v, containers):
+                        push((v, base_uri, resolving, copied, i, kind))
+            else:
+                copied = node
+                for hop_key in memo_keys:
+                    memo[hop_key] = copied
+            
+            parent[key] = copied
+        
+        return result[0]
+    
     def flatten_nested_properties(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """
         Flatten unnecessarily nested properties in the schema.
@@ -108,30 +626,11 @@ class SchemaBundler:
         Returns:
             Schema with flattened properties
         """
-        if "properties" not in schema:
-            return schema
-        
-        properties = schema["properties"]
-        flattened_properties = {}
-        
-        for prop_name, prop_value in properties.items():
-            if (
-                isinstance(prop_value, dict)
-                and "properties" in prop_value
-                and prop_name in prop_value["properties"]
-            ):
-                # Flatten the nested property
-                flattened_properties[prop_name] = prop_value["properties"][prop_name]
-            else:
-                # Keep the property as-is
-                flattened_properties[prop_name] = prop_value
-        
-        schema["properties"] = flattened_properties
-        return schema
+        return self._finalize_properties(schema, flatten=True, set_required=False)
     
     def set_all_properties_required(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Set all top-level properties as required.
+        Set all properties of the given schema as required.
         
         Args:
             schema: The schema to modify
@@ -139,8 +638,54 @@ class SchemaBundler:
         Returns:
             Schema with all properties marked as required
         """
-        if "properties" in schema:
-            schema["required"] = list(schema["properties"].keys())
+        return self._finalize_properties(schema, flatten=False, set_required=True)
+    
+    def _finalize_properties(
+        self,
+        schema: Dict[str, Any],
+        flatten: bool,
+        set_required: bool,
+        lazy_required: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Flatten nested properties and/or mark them required in a single pass.
+        
+        Args:
+            schema: The schema to modify
+            flatten: Whether to flatten nested properties
+            set_required: Whether to set all properties as required
+            lazy_required: Store a placeholder that only becomes the required
+                list when serialized with _json_default
+            
+        Returns:
+            The modified schema
+        """
+        if "properties" not in schema or not (flatten or set_required):
+            return schema
+        
+        properties = schema["properties"]
+        build_required = set_required and not lazy_required
+        required = []
+        
+        if flatten:
+            flattened_properties = {}
+            for prop_name, prop_value in properties.items():
+                if (
+                    isinstance(prop_value, dict)
+                    and "properties" in prop_value
+                    and prop_name in prop_value["properties"]
+                ):
+                    # Flatten the nested property
+                    prop_value = prop_value["properties"][prop_name]
+                flattened_properties[prop_name] = prop_value
+                if build_required:
+                    required.append(sys.intern(prop_name))
+            schema["properties"] = properties = flattened_properties
+        elif build_required:
+            required = [sys.intern(prop_name) for prop_name in properties]
+        
+        if set_required:
+            schema["required"] = _AllPropertiesRequired(properties) if lazy_required else required
         return schema
     
     def bundle_schema(
@@ -148,7 +693,8 @@ class SchemaBundler:
         input_file: Union[str, Path], 
         output_file: Union[str, Path],
         flatten_properties: bool = True,
-        set_required: bool = True
+        set_required: bool = True,
+        use_cache: bool = True
     ) -> None:
         """
         Bundle a JSON schema with reference resolution.
@@ -158,44 +704,63 @@ class SchemaBundler:
             output_file: Path to output bundled schema file
             flatten_properties: Whether to flatten nested properties
             set_required: Whether to set all properties as required
+            use_cache: Whether to reuse the resolved schema when neither the input
+                file nor any file it references has changed
             
         Raises:
             FileNotFoundError: If input file doesn't exist
             Exception: If bundling process fails
         """
-        input_path = Path(input_file)
-        output_path = Path(output_file)
+        # Plain string paths: pathlib re-parses the path on every operation
+        input_path = os.fspath(input_file)
+        output_path = os.fspath(output_file)
+        abs_path = os.path.abspath(input_path)
         
-        # Ensure input file exists
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input schema file not found: {input_path}")
+        # Touch the input once up front (stat for the cache key, or the load itself),
+        # reporting a missing file without a separate existence check
+        try:
+            if use_cache:
+                mtime_ns = os.stat(abs_path).st_mtime_ns
+            else:
+                raw_schema = self.load_schema(abs_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Input schema file not found: {input_path}") from e
+        except Exception as e:
+            raise Exception(f"Failed to bundle schema: {str(e)}")
         
         try:
-            # Read the input schema
-            with open(input_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Resolve references if jsonref is available
-            if jsonref is not None:
-                schema = self.resolve_references(content)
+            # Load, resolve and transform the input schema in a single walk
+            if use_cache:
+                schema = _parse_and_transform(
+                    abs_path, mtime_ns, self._abs_base, flatten_properties, set_required
+                )
             else:
-                # Fallback to simple JSON loading
-                schema = json.loads(content)
-                print("Warning: References not resolved due to missing jsonref library")
-            
-            # Apply optional transformations
-            if flatten_properties:
-                schema = self.flatten_nested_properties(schema)
-            
-            if set_required:
-                schema = self.set_all_properties_required(schema)
+                schema = self._walk_and_transform(
+                    raw_schema, flatten_properties, set_required, lazy_required=True
+                )
             
             # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
             
-            # Write the bundled schema
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(schema, f, indent=2, ensure_ascii=False)
+            # Serialize into a single buffer and write it with one call
+            data = _json_dumps(schema)
+            
+            # Write to a temporary file first so a failure never leaves a partial
+            # output; the name is unique per process and thread, so concurrent
+            # bundles of the same output never write or remove each other's file
+            tmp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, output_path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
             
             print(f"Successfully bundled schema: {input_path} -> {output_path}")
             
@@ -203,6 +768,68 @@ class SchemaBundler:
             raise Exception(f"Failed to bundle schema: {str(e)}")
 
 
+# Bundled schemas of this process by (input path, base path, flatten, set_required),
+# each stored as (input mtime_ns, referenced file stamps, schema); see _parse_and_transform
+_BUNDLE_CACHE: Dict[Tuple[str, str, bool, bool], Tuple[int, Tuple[Tuple[str, int], ...], Dict[str, Any]]] = {}
+_BUNDLE_CACHE_SIZE = 128
+_BUNDLE_CACHE_LOCK = threading.Lock()
+
+
+def _sources_unchanged(sources: Tuple[Tuple[str, int], ...]) -> bool:
+    """Whether every (path, mtime_ns) pair still matches the file on disk"""
+    for path, mtime_ns in sources:
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _parse_and_transform(
+    abs_path: str, mtime_ns: int, base_path: str, flatten: bool, set_required: bool
+) -> Dict[str, Any]:
+    """
+    Load, resolve and transform a schema file, cached per process.
+    
+    A cache entry records the modification time of the input file and of every
+    referenced file read to build it, and is only reused while all of them are
+    unchanged, so editing any document of the bundle rebuilds it. Bundles that
+    read documents from URLs are not cached, since those can't be checked.
+    
+    Args:
+        abs_path: Absolute path to the schema file
+        mtime_ns: Modification time of the schema file in nanoseconds
+        base_path: Base path for resolving relative schema references
+        flatten: Whether to flatten nested properties
+        set_required: Whether to set all properties as required
+        
+    Returns:
+        Bundled schema dictionary, which callers must not mutate and must
+        serialize with default=_json_default
+    """
+    key = (abs_path, base_path, flatten, set_required)
+    with _BUNDLE_CACHE_LOCK:
+        entry = _BUNDLE_CACHE.pop(key, None)
+    if entry is not None and entry[0] == mtime_ns and _sources_unchanged(entry[1]):
+        schema = entry[2]
+    else:
+        bundler = SchemaBundler(base_path)
+        schema = bundler._walk_and_transform(
+            bundler.load_schema(abs_path), flatten, set_required, lazy_required=True
+        )
+        sources = bundler._source_stamps()
+        entry = None if sources is None else (mtime_ns, sources, schema)
+    
+    if entry is not None:
+        with _BUNDLE_CACHE_LOCK:
+            # Re-inserted last, so the first entry is always the least recently used
+            _BUNDLE_CACHE[key] = entry
+            if len(_BUNDLE_CACHE) > _BUNDLE_CACHE_SIZE:
+                del _BUNDLE_CACHE[next(iter(_BUNDLE_CACHE))]
+    return schema
+
+
 def main():
     """Main function with command-line interface"""
     parser = argparse.ArgumentParser(
@@ -214,6 +841,7 @@ Examples:
   %(prog)s schema.json -o output.json     # Bundle to specific output file
   %(prog)s schema.json --no-flatten       # Skip property flattening
   %(prog)s schema.json --no-required      # Don't set all properties as required
+  %(prog)s schema.json --no-cache         # Always re-parse and re-resolve the input
         """
     )
     
@@ -239,6 +867,12 @@ Examples:
         help="Don't automatically set all properties as required"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't reuse resolved schemas of unchanged input files"
+    )
+    
     parser.add_argument(
         "--base-path",
         help="Base path for resolving relative schema references"
@@ -262,7 +896,8 @@ Examples:
             input_file=args.input,
             output_file=output_file,
             flatten_properties=not args.no_flatten,
-            set_required=not args.no_required
+            set_required=not args.no_required,
+            use_cache=not args.no_cache
         )
         
         return 0
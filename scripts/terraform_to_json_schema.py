@@ -6,20 +6,148 @@ Using advanced libraries for maximum reliability and genericity
 
 import json
 import argparse
+import copy
+import functools
+import hashlib
+import importlib.util
+import math
 import os
 import sys
 import re
-from typing import Dict, Any, List, Optional, Union
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
-# Try to import professional libraries
-try:
-    import hcl2
-    from jsonschema import Draft7Validator, validators
-except ImportError as e:
-    print(f"Error: Required libraries not found. Please install them with: pip install python-hcl2 jsonschema")
+# Check for professional libraries up front; hcl2 itself (and its grammar)
+# is only imported once a file actually has to be parsed, so --help and
+# cached conversions don't pay for it
+if importlib.util.find_spec("hcl2") is None:
+    print(f"Error: Required libraries not found. Please install them with: pip install python-hcl2")
     sys.exit(1)
 
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Regular expressions compiled once at import time instead of on every call
+# Opening of a complex type call such as "list(" or "object ("
+_TYPE_CALL_PATTERNS = {
+    type_name: re.compile(rf"{type_name}\s*\(")
+    for type_name in ("list", "map", "set", "object")
+}
+# A single "name": type pair from HCL-parsed object content
+_OBJECT_PROPERTY_PATTERN = re.compile(r'^\s*["\']?([^"\':]+)["\']?\s*:\s*(.+)$')
+# contains([...], x.property) calls in validation conditions
+_CONTAINS_PATTERNS = [
+    # Pattern 1: Standard contains with direct property access
+    re.compile(r'contains\s*\(\s*\[([^\]]+)\]\s*,\s*[^.]+\.(\w+)\s*\)'),
+    # Pattern 2: Contains within flatten iteration (most common in complex validation)
+    re.compile(r'contains\s*\(\s*\[([^\]]+)\]\s*,\s*(\w+)\.(\w+)\s*\)'),
+]
+# Double-quoted literal inside an enum array
+_QUOTED_VALUE_PATTERN = re.compile(r'"([^"]+)"')
+# Either parenthesis, for bracket matching
+_PAREN_PATTERN = re.compile(r"[()]")
+# Tokens that matter when splitting at top-level commas: a quoted string
+# (running to the end of the text if unterminated) or one structural character
+_STRUCTURAL_TOKEN_PATTERN = re.compile(r""""[^"]*(?:"|\Z)|'[^']*(?:'|\Z)|[(){}\[\],]""")
+
+# JSON Schema templates for Terraform primitive types
+_SIMPLE_TYPE_SCHEMAS = {
+    "string": {"type": "string"},
+    "number": {"type": "number"},
+    "bool": {"type": "boolean"},
+    "any": {},
+}
+
+# Constant parts of generated object schemas; per-schema "properties" and
+# "required" containers are added on copy so templates are never shared
+_OBJECT_SCHEMA_TEMPLATE = {"type": "object", "additionalProperties": True}
+_ROOT_SCHEMA_TEMPLATE = {"$schema": "http://json-schema.org/draft-07/schema#", **_OBJECT_SCHEMA_TEMPLATE}
+
+# Case-insensitive literal default values
+_LITERAL_DEFAULTS = {"true": True, "false": False, "null": None}
+# Characters a JSON number can start with
+_NUMBER_START_CHARS = frozenset("-0123456789")
+# Non-digit characters Python's int()/float() accept at the start of a number
+_LENIENT_NUMBER_START_CHARS = frozenset("+-.")
+
+
+def _reject_json_constant(name: str) -> Any:
+    """parse_constant hook: json accepts NaN/Infinity/-Infinity, JSON numbers don't"""
+    raise ValueError(f"{name} is not a JSON number")
+
+
+def _parse_finite_float(text: str) -> float:
+    """parse_float hook rejecting literals such as 1e400 that overflow to infinity"""
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"{text} is out of range")
+    return value
+
+
+# Decoder for plain JSON number defaults; built once so parsing stays in C
+_JSON_NUMBER_DECODER = json.JSONDecoder(
+    parse_constant=_reject_json_constant, parse_float=_parse_finite_float
+)
+
+
+# Fallback encoders for _dumps_schema, built once instead of per json.dumps call
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False)
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+# orjson writes floats between 1e-9 and 1e-4 as "1e-7" or "0.00001" where
+# json writes "1e-07" and "1e-05"; output holding either form is redone with
+# json (a match inside a string only costs the slower dump). Two searches,
+# since an alternation would defeat the regex engine's literal prefix scan
+_ORJSON_SHORT_EXPONENT = re.compile(rb"e-\d(?!\d)")
+_ORJSON_SMALL_DECIMAL = b"0.0000"
+
+
+def _orjson_float_differs(data: bytes) -> bool:
+    """Check whether orjson output may spell a float differently from json"""
+    return _ORJSON_SMALL_DECIMAL in data or _ORJSON_SHORT_EXPONENT.search(data) is not None
+
+
+def _dumps_schema(schema: Dict[str, Any], pretty: bool = True) -> bytes:
+    """
+    Serialize a schema to UTF-8 JSON, indented by 4 spaces unless compact
+
+    orjson only supports 2-space indentation, so its output is widened level
+    by level, deepest first. orjson escapes every control character, so a raw
+    NUL never occurs in its output and is safe as a placeholder. Output that
+    may hold a small float orjson formats differently from json is discarded.
+
+    Args:
+        schema: JSON Schema to serialize
+        pretty: Indent the output; otherwise emit it without any whitespace
+
+    Returns:
+        Serialized schema, byte-identical to json.dumps(indent=4, ensure_ascii=False)
+        or, when not pretty, to json.dumps(separators=(",", ":"), ensure_ascii=False)
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(schema, option=orjson.OPT_INDENT_2 if pretty else None)
+        except TypeError:
+            # Non-string keys or integers orjson cannot represent
+            data = None
+        if data is not None and _orjson_float_differs(data):
+            data = None
+        if data is not None and not pretty:
+            return data
+        if data is not None:
+            depth = 0
+            while b"\n" + b"  " * (depth + 1) in data:
+                depth += 1
+            for level in range(depth, 0, -1):
+                data = data.replace(b"\n" + b"  " * level, b"\n" + b"\0" * level)
+            return data.replace(b"\0", b"    ")
+    encoder = _PRETTY_JSON_ENCODER if pretty else _COMPACT_JSON_ENCODER
+    return encoder.encode(schema).encode("utf-8")
+
 
 class TerraformTypeParser:
     """Advanced parser for Terraform type expressions"""
@@ -34,12 +162,26 @@ class TerraformTypeParser:
         """
         Parse a Terraform type expression into JSON Schema structure
         
+        Parsing is a pure function of the expression, so results are memoized
+        per process; each call gets its own copy of the cached schema.
+        
         Args:
             type_expr: Terraform type expression string
             
         Returns:
             JSON Schema compatible dictionary with proper required field tracking
         """
+        schema, required_fields, optional_fields = _parse_type_expression_cached(type_expr)
+        
+        # Restore the field tracking state the parse left behind
+        self.required_fields = set(required_fields)
+        self.optional_fields = set(optional_fields)
+        self.current_depth = 0
+        
+        return copy.deepcopy(schema)
+    
+    def _parse_type_expression_uncached(self, type_expr: str) -> Dict[str, Any]:
+        """Parse a Terraform type expression without consulting the cache"""
         # Reset field tracking for this parse
         self.required_fields = set()
         self.optional_fields = set()
@@ -53,10 +195,11 @@ class TerraformTypeParser:
         
         # Add required/optional field information to schema
         if "properties" in schema and isinstance(schema["properties"], dict):
-            required_list = []
-            for field_name in schema["properties"].keys():
-                if field_name not in self.optional_fields and field_name != "id":
-                    required_list.append(field_name)
+            optional_fields = self.optional_fields
+            required_list = [
+                field_name for field_name in schema["properties"]
+                if field_name not in optional_fields and field_name != "id"
+            ]
             if required_list:
                 schema["required"] = required_list
         
@@ -73,59 +216,74 @@ class TerraformTypeParser:
     def _parse_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
         """Parse a cleaned expression with field name context for tracking optional fields"""
         # Handle simple types
-        if expr in ["string", "number", "bool", "any"]:
+        if expr in _SIMPLE_TYPE_SCHEMAS:
             return self._create_simple_type(expr)
         
-        # Handle complex types
-        # List type
-        if expr.startswith("list("):
-            inner_type = self._extract_inner_type(expr, "list")
-            current_depth = getattr(self, 'current_depth', 0)
-            self.current_depth = current_depth + 1  # Increase depth for nested parsing
-            result = self._create_list_type(self._parse_expression(inner_type, field_name), current_depth)
-            self.current_depth = current_depth  # Restore original depth
-            return result
-        
-        # Map type
-        if expr.startswith("map("):
-            inner_type = self._extract_inner_type(expr, "map")
-            return self._create_map_type(self._parse_expression(inner_type, field_name))
-        
-        # Set type
-        if expr.startswith("set("):
-            inner_type = self._extract_inner_type(expr, "set")
-            return self._create_set_type(self._parse_expression(inner_type, field_name))
-        
-        # Object type
-        if expr.startswith("object("):
-            inner_content = self._extract_inner_type(expr, "object")
-            current_depth = getattr(self, 'current_depth', 0)
-            return self._create_object_type(self._parse_object_content(inner_content), current_depth)
-        
-        # Optional type - this is key for tracking required vs optional fields
-        if expr.startswith("optional("):
-            # Extract inner type and default value if present
-            parts = self._extract_optional_parts(expr)
-            inner_type = parts[0]
-            default_value = parts[1] if len(parts) > 1 else None
-            
-            # Mark this field as optional
-            if field_name:
-                self.optional_fields.add(field_name)
-            
-            schema = self._parse_expression(inner_type, field_name)
-            if default_value is not None:
-                schema["default"] = self._parse_default_value(default_value)
-            return schema
+        # Handle complex types, dispatching on the type keyword before "("
+        paren = expr.find("(")
+        if paren != -1:
+            handler = self._COMPLEX_TYPE_HANDLERS.get(expr[:paren])
+            if handler is not None:
+                return handler(self, expr, field_name)
         
         # If we can't parse it, treat as string
         return {"type": "string"}
     
+    def _parse_list_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
+        """Parse a list(...) expression"""
+        inner_type = self._extract_inner_type(expr, "list")
+        current_depth = getattr(self, 'current_depth', 0)
+        self.current_depth = current_depth + 1  # Increase depth for nested parsing
+        result = self._create_list_type(self._parse_expression(inner_type, field_name), current_depth)
+        self.current_depth = current_depth  # Restore original depth
+        return result
+    
+    def _parse_map_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
+        """Parse a map(...) expression"""
+        inner_type = self._extract_inner_type(expr, "map")
+        return self._create_map_type(self._parse_expression(inner_type, field_name))
+    
+    def _parse_set_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
+        """Parse a set(...) expression"""
+        inner_type = self._extract_inner_type(expr, "set")
+        return self._create_set_type(self._parse_expression(inner_type, field_name))
+    
+    def _parse_object_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
+        """Parse an object(...) expression"""
+        inner_content = self._extract_inner_type(expr, "object")
+        current_depth = getattr(self, 'current_depth', 0)
+        return self._create_object_type(self._parse_object_content(inner_content), current_depth)
+    
+    def _parse_optional_expression(self, expr: str, field_name: str = None) -> Dict[str, Any]:
+        """Parse an optional(type, default) expression - this is key for tracking required vs optional fields"""
+        # Extract inner type and default value if present
+        parts = self._extract_optional_parts(expr)
+        inner_type = parts[0]
+        default_value = parts[1] if len(parts) > 1 else None
+        
+        # Mark this field as optional
+        if field_name:
+            self.optional_fields.add(field_name)
+        
+        schema = self._parse_expression(inner_type, field_name)
+        if default_value is not None:
+            schema["default"] = self._parse_default_value(default_value)
+        return schema
+    
+    # Complex type keyword -> parser, resolved with a single dict lookup
+    _COMPLEX_TYPE_HANDLERS = {
+        "list": _parse_list_expression,
+        "map": _parse_map_expression,
+        "set": _parse_set_expression,
+        "object": _parse_object_expression,
+        "optional": _parse_optional_expression,
+    }
+    
     def _extract_inner_type(self, expr: str, type_name: str) -> str:
         """Extract the inner type from a complex type expression"""
         # Find the opening parenthesis after the type name
-        pattern = rf"{type_name}\s*\("
-        match = re.search(pattern, expr)
+        pattern = _TYPE_CALL_PATTERNS.get(type_name) or re.compile(rf"{type_name}\s*\(")
+        match = pattern.search(expr)
         if not match:
             return "string"  # Default fallback
         
@@ -150,64 +308,51 @@ class TerraformTypeParser:
     def _find_matching_paren(self, text: str, start_pos: int) -> int:
         """Find the matching closing parenthesis"""
         count = 1
-        pos = start_pos + 1
         
-        while pos < len(text) and count > 0:
-            if text[pos] == "(":
+        # Jump straight between parentheses instead of testing every character
+        for match in _PAREN_PATTERN.finditer(text, start_pos + 1):
+            if match.group() == "(":
                 count += 1
-            elif text[pos] == ")":
+            else:
                 count -= 1
-            pos += 1
+                if count == 0:
+                    return match.start()
         
-        return pos - 1
+        # Unbalanced: the expression runs to the end of the text
+        return len(text) - 1
     
     def _split_by_top_level_comma(self, text: str) -> List[str]:
         """Split text by commas at the top level"""
         parts = []
-        current_part = ""
+        start = 0  # Start index of the current part, sliced out when it ends
         paren_count = 0
         brace_count = 0
         bracket_count = 0
-        in_string = False
-        string_char = None
-        
-        for char in text:
-            if char in ['"', "'"] and not in_string:
-                in_string = True
-                string_char = char
-                current_part += char
-            elif char == string_char and in_string:
-                in_string = False
-                string_char = None
-                current_part += char
-            elif in_string:
-                current_part += char
-            elif char == "(":
+        
+        # The tokenizer yields whole quoted strings and single structural
+        # characters only, so everything in between is skipped in C
+        for match in _STRUCTURAL_TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            if token == "(":
                 paren_count += 1
-                current_part += char
-            elif char == ")":
+            elif token == ")":
                 paren_count -= 1
-                current_part += char
-            elif char == "{":
+            elif token == "{":
                 brace_count += 1
-                current_part += char
-            elif char == "}":
+            elif token == "}":
                 brace_count -= 1
-                current_part += char
-            elif char == "[":
+            elif token == "[":
                 bracket_count += 1
-                current_part += char
-            elif char == "]":
+            elif token == "]":
                 bracket_count -= 1
-                current_part += char
-            elif char == "," and paren_count == 0 and brace_count == 0 and bracket_count == 0:
-                parts.append(current_part.strip())
-                current_part = ""
-            else:
-                current_part += char
+            elif token == "," and paren_count == 0 and brace_count == 0 and bracket_count == 0:
+                pos = match.start()
+                parts.append(text[start:pos].strip())
+                start = pos + 1
         
-        if current_part.strip():
-            parts.append(current_part.strip())
+        last_part = text[start:].strip()
+        if last_part:
+            parts.append(last_part)
         
         return parts
     
@@ -215,8 +360,9 @@ class TerraformTypeParser:
         """Parse object content into properties generically"""
         properties = {}
         
-        # Store the current optional fields state
-        parent_optional_fields = self.optional_fields.copy()
+        # Store the current optional fields state; the parent set is swapped
+        # out rather than mutated, so holding a reference is enough
+        parent_optional_fields = self.optional_fields
         # Reset for this object scope
         self.optional_fields = set()
         
@@ -227,7 +373,6 @@ class TerraformTypeParser:
         
         # The HCL parser gives us content like:
         # "hostname": "string", "ecs_size": "string", "az": "string", ...
-        import re
         
         # Split by commas at the top level (outside of nested structures)
         property_pairs = self._split_by_top_level_comma(content)
@@ -239,7 +384,7 @@ class TerraformTypeParser:
             
             # Parse each property assignment
             # Handle both "property": "type" and property: type formats
-            colon_match = re.search(r'^\s*["\']?([^"\':]+)["\']?\s*:\s*(.+)$', pair)
+            colon_match = _OBJECT_PROPERTY_PATTERN.search(pair)
             if colon_match:
                 prop_name = colon_match.group(1).strip()
                 prop_type_str = colon_match.group(2).strip()
@@ -256,26 +401,21 @@ class TerraformTypeParser:
                 prop_schema = self._parse_expression(prop_type_str, prop_name)
                 properties[prop_name] = prop_schema
         
-        # Get the optional fields for this scope
-        local_optional_fields = self.optional_fields.copy()
+        # Get the optional fields for this scope; nothing else holds this set
+        local_optional_fields = self.optional_fields
         
         # Restore parent scope
         self.optional_fields = parent_optional_fields
         
         # Build required list based on local scope
-        required_list = []
-        for prop_name in properties.keys():
-            prop_schema = properties[prop_name]
-            # A field is required if:
-            # 1. It's not the id field (always optional)
-            # 2. It doesn't have a default value
-            # 3. It wasn't parsed from an optional() wrapper in this scope
-            is_id_field = prop_name == "id"
-            has_default = "default" in prop_schema
-            is_optional = prop_name in local_optional_fields
-            
-            if not is_id_field and not has_default and not is_optional:
-                required_list.append(prop_name)
+        # A field is required if:
+        # 1. It's not the id field (always optional)
+        # 2. It doesn't have a default value
+        # 3. It wasn't parsed from an optional() wrapper in this scope
+        required_list = [
+            prop_name for prop_name, prop_schema in properties.items()
+            if prop_name != "id" and "default" not in prop_schema and prop_name not in local_optional_fields
+        ]
         
         # Store required info in a way we can use it in _create_object_type
         # We'll attach this information to the properties dict
@@ -286,19 +426,17 @@ class TerraformTypeParser:
     def _parse_default_value(self, value_str: str) -> Any:
         """Parse a default value string"""
         value_str = value_str.strip()
+        # Most branches only need the first character, so slice it once
+        first = value_str[:1]
         
         # Handle quoted strings
-        if (value_str.startswith('"') and value_str.endswith('"')) or \
-           (value_str.startswith("'") and value_str.endswith("'")):
+        if first in ('"', "'") and value_str.endswith(first):
             return value_str[1:-1]
         
-        # Handle booleans
-        if value_str.lower() in ["true", "false"]:
-            return value_str.lower() == "true"
-        
-        # Handle null
-        if value_str.lower() == "null":
-            return None
+        # Handle booleans and null
+        lowered = value_str.lower()
+        if lowered in _LITERAL_DEFAULTS:
+            return _LITERAL_DEFAULTS[lowered]
         
         # Handle empty objects and arrays
         if value_str == "{}":
@@ -306,30 +444,33 @@ class TerraformTypeParser:
         if value_str == "[]":
             return []
         
-        # Handle numbers
-        try:
-            if "." in value_str:
-                return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            pass
+        # Handle numbers, parsing plain JSON numbers in C first; non-finite
+        # values (-Infinity, 1e400) have no JSON form and stay strings
+        if first in _NUMBER_START_CHARS:
+            try:
+                return _JSON_NUMBER_DECODER.decode(value_str)
+            except ValueError:
+                pass
+        # int()/float() only accept text starting with a sign, a point or a
+        # decimal digit, so other values skip the raise-and-catch entirely
+        if first in _LENIENT_NUMBER_START_CHARS or first.isdecimal():
+            try:
+                if "." in value_str:
+                    value = float(value_str)
+                    if math.isfinite(value):
+                        return value
+                else:
+                    return int(value_str)
+            except ValueError:
+                pass
         
         # Default to string
         return value_str
     
     def _create_simple_type(self, type_name: str) -> Dict[str, Any]:
         """Create schema for simple types"""
-        if type_name == "string":
-            return {"type": "string"}
-        elif type_name == "number":
-            return {"type": "number"}
-        elif type_name == "bool":
-            return {"type": "boolean"}
-        elif type_name == "any":
-            return {}
-        else:
-            return {"type": "string"}
+        # Copy so callers can add defaults or enums without touching the template
+        return dict(_SIMPLE_TYPE_SCHEMAS.get(type_name, _SIMPLE_TYPE_SCHEMAS["string"]))
     
     def _create_list_type(self, element_schema: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
         """Create schema for list type"""
@@ -351,41 +492,6 @@ class TerraformTypeParser:
             # Mark id as optional so it's not added to required fields
             self.optional_fields.add("id")
     
-    def _find_property_end(self, content: str, start_pos: int) -> int:
-        """Find the end of a property definition in object content"""
-        paren_count = 0
-        brace_count = 0
-        bracket_count = 0
-        in_string = False
-        i = start_pos
-        
-        while i < len(content):
-            char = content[i]
-            
-            if char == '"' and (i == 0 or content[i-1] != '\\'):
-                in_string = not in_string
-            elif not in_string:
-                if char == '(':
-                    paren_count += 1
-                elif char == ')':
-                    paren_count -= 1
-                elif char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                elif char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
-                elif (char.isalpha() or char == '_') and paren_count == 0 and brace_count == 0 and bracket_count == 0:
-                    # Look ahead to see if this might be the start of a new property
-                    lookahead = content[i:i+50]  # Look ahead 50 chars
-                    if re.search(r'^\w+\s*=', lookahead):
-                        return i
-            i += 1
-        
-        return len(content)
-    
     def _create_map_type(self, value_schema: Dict[str, Any]) -> Dict[str, Any]:
         """Create schema for map type"""
         return {"type": "object", "additionalProperties": value_schema}
@@ -399,11 +505,7 @@ class TerraformTypeParser:
         # Extract required fields info if present
         required_list = properties.pop("__required_fields__", [])
         
-        schema = {
-            "type": "object",
-            "additionalProperties": True,
-            "properties": properties,
-        }
+        schema = dict(_OBJECT_SCHEMA_TEMPLATE, properties=properties)
         
         if required_list:
             schema["required"] = required_list
@@ -411,20 +513,43 @@ class TerraformTypeParser:
         return schema
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_type_expression_cached(type_expr: str):
+    """
+    Parse a type expression once per distinct string
+    
+    Args:
+        type_expr: Terraform type expression string
+        
+    Returns:
+        Tuple of (schema, required fields, optional fields); the schema is
+        shared between callers and must be copied before mutation
+    """
+    parser = TerraformTypeParser()
+    schema = parser._parse_type_expression_uncached(type_expr)
+    return schema, frozenset(parser.required_fields), frozenset(parser.optional_fields)
+
+
 class GenericTerraformParser:
     """Generic Terraform parser using professional libraries"""
     
     def parse_file(self, file_path: str) -> Dict[str, Any]:
         """Parse a Terraform file and extract variable definitions"""
+        # A missing file surfaces from open() itself, with no separate exists() stat
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
         except FileNotFoundError:
-            raise FileNotFoundError(f"Input file '{file_path}' not found")
+            raise FileNotFoundError(f"Input file '{file_path}' does not exist")
         
-        # Parse HCL using professional library
+        return self.parse_text(content)
+    
+    def parse_text(self, content: str) -> Dict[str, Any]:
+        """Parse Terraform source text and extract variable definitions"""
+        # Parse HCL using professional library; identical text (shared or
+        # copied variables.tf files) is parsed once per process
         try:
-            parsed = hcl2.loads(content)
+            parsed = copy.deepcopy(_load_hcl_cached(content))
         except Exception as e:
             raise Exception(f"Error parsing HCL file: {str(e)}")
         
@@ -458,6 +583,27 @@ class GenericTerraformParser:
         return processed
 
 
+@functools.lru_cache(maxsize=64)
+def _load_hcl_cached(content: str) -> Dict[str, Any]:
+    """
+    Parse HCL text once per distinct content
+    
+    hcl2.loads dominates conversion time, and monorepos often carry many
+    byte-identical variables.tf files. Keying on the text itself also hits
+    when a file is touched without changing. lru_cache is thread-safe and
+    does not cache failures, so parse errors are raised on every call.
+    
+    Args:
+        content: Terraform source text
+        
+    Returns:
+        Parsed HCL structure; shared between callers and must be copied
+        before mutation
+    """
+    import hcl2
+    return hcl2.loads(content)
+
+
 class GenericJSONSchemaGenerator:
     """Truly generic JSON Schema generator"""
     
@@ -475,13 +621,7 @@ class GenericJSONSchemaGenerator:
     
     def generate_schema(self, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Generate JSON Schema from variables in a truly generic way"""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "additionalProperties": True,
-            "properties": {},
-            "required": [],
-        }
+        schema = dict(_ROOT_SCHEMA_TEMPLATE, properties={}, required=[])
         
         for var_name, var_def in variables.items():
             prop_schema = self._convert_to_schema(var_def, [var_name])
@@ -523,6 +663,10 @@ class GenericJSONSchemaGenerator:
         if not validations:
             return
         
+        # Built on the first contains() condition and shared by the rest, so
+        # each enum is a lookup instead of another walk over the schema
+        property_index = None
+        
         for validation in validations:
             condition = validation.get("condition", "")
             error_message = validation.get("error_message", "")
@@ -533,27 +677,26 @@ class GenericJSONSchemaGenerator:
                 clean_condition = clean_condition[2:-1]
             
             # Extract enum values from contains() functions with improved patterns
-            self._extract_and_apply_enums(schema, clean_condition)
+            if property_index is None and "contains" in clean_condition:
+                property_index = self._build_property_index(schema)
+            self._extract_and_apply_enums(schema, clean_condition, property_index)
     
-    def _extract_and_apply_enums(self, schema: Dict[str, Any], condition: str) -> None:
+    def _extract_and_apply_enums(self, schema: Dict[str, Any], condition: str,
+                                 property_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> None:
         """Extract enum values from validation conditions and apply them to the schema"""
-        import re
-        
         # Enhanced pattern to match contains() function calls with enum arrays
         # This handles multiple patterns:
         # 1. Direct: contains(["val1", "val2"], var.property)
         # 2. Simple iteration: contains(["val1", "val2"], item.property) 
         # 3. Flatten pattern: contains(["val1", "val2"], flattened_item.property)
-        contains_patterns = [
-            # Pattern 1: Standard contains with direct property access
-            r'contains\s*\(\s*\[([^\]]+)\]\s*,\s*[^.]+\.(\w+)\s*\)',
-            # Pattern 2: Contains within flatten iteration (most common in complex validation)
-            r'contains\s*\(\s*\[([^\]]+)\]\s*,\s*(\w+)\.(\w+)\s*\)'
-        ]
+        # Conditions without a contains() call (length checks, regex(), ...)
+        # can't yield enums, so skip both pattern scans with one substring test
+        if "contains" not in condition:
+            return
         
         all_matches = []
-        for pattern in contains_patterns:
-            matches = re.findall(pattern, condition)
+        for pattern in _CONTAINS_PATTERNS:
+            matches = pattern.findall(condition)
             
             # Handle different match group structures
             for match in matches:
@@ -567,8 +710,7 @@ class GenericJSONSchemaGenerator:
         for array_content, property_name in all_matches:
             # Extract both quoted and unquoted values from the array content
             # First try quoted strings
-            quoted_pattern = r'"([^"]+)"'
-            enum_values = re.findall(quoted_pattern, array_content)
+            enum_values = _QUOTED_VALUE_PATTERN.findall(array_content)
             
             # If no quoted strings found, try unquoted identifiers
             if not enum_values:
@@ -578,109 +720,147 @@ class GenericJSONSchemaGenerator:
             
             if enum_values:
                 # Apply enum to the appropriate property in the schema
-                self._apply_enum_to_schema_property(schema, property_name, enum_values)
+                self._apply_enum_to_schema_property(schema, property_name, enum_values, property_index)
     
-    def _apply_enum_to_schema_property(self, schema: Dict[str, Any], property_name: str, enum_values: List[str]) -> bool:
+    def _apply_enum_to_schema_property(self, schema: Dict[str, Any], property_name: str, enum_values: List[str],
+                                       property_index: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> bool:
         """Apply enum values to a specific property in the schema structure"""
-        
-        def apply_enum_recursively(obj: Dict[str, Any], prop_name: str, values: List[str]) -> bool:
-            """Recursively search for and apply enum to the specified property"""
-            applied = False
+        # With an index from _build_property_index, go straight to the matches
+        if property_index is not None:
+            owners = property_index.get(property_name, ())
+            for properties in owners:
+                properties[property_name]["enum"] = enum_values
+            return bool(owners)
+        
+        applied = False
+        
+        # Walk the schema with an explicit stack instead of recursing; every
+        # match gets the enum, so visiting order doesn't affect the result
+        stack = [schema]
+        while stack:
+            obj = stack.pop()
             
-            # Handle array schemas - recurse into items
+            # Handle array schemas - descend into items
             if obj.get("type") == "array" and "items" in obj:
-                if apply_enum_recursively(obj["items"], prop_name, values):
-                    applied = True
+                stack.append(obj["items"])
             
             # Check direct properties
             elif "properties" in obj and isinstance(obj["properties"], dict):
                 properties = obj["properties"]
-                if prop_name in properties and isinstance(properties[prop_name], dict):
-                    properties[prop_name]["enum"] = values
+                if property_name in properties and isinstance(properties[property_name], dict):
+                    properties[property_name]["enum"] = enum_values
                     applied = True
                 
                 # Also search in nested objects and arrays
-                for nested_prop_name, prop_schema in properties.items():
+                for prop_schema in properties.values():
                     if isinstance(prop_schema, dict):
                         # Check array items
                         if prop_schema.get("type") == "array" and "items" in prop_schema:
-                            if apply_enum_recursively(prop_schema["items"], prop_name, values):
-                                applied = True
+                            stack.append(prop_schema["items"])
                         # Check nested objects
                         elif prop_schema.get("type") == "object":
-                            if apply_enum_recursively(prop_schema, prop_name, values):
-                                applied = True
-            
-            return applied
+                            stack.append(prop_schema)
         
-        # Apply the enum starting from the root schema
-        return apply_enum_recursively(schema, property_name, enum_values)
+        return applied
+    
+    def _build_property_index(self, schema: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Map each property name to the "properties" dicts that define it
+        
+        Uses the same descent rules as _apply_enum_to_schema_property, so a
+        lookup finds exactly the properties a walk would. Applying an enum
+        only adds keys to property schemas, which keeps the index valid.
+        
+        Args:
+            schema: Schema to index
+            
+        Returns:
+            Property name -> list of "properties" dicts holding a schema for it
+        """
+        index = {}
+        stack = [schema]
+        while stack:
+            obj = stack.pop()
+            if obj.get("type") == "array" and "items" in obj:
+                stack.append(obj["items"])
+            elif "properties" in obj and isinstance(obj["properties"], dict):
+                properties = obj["properties"]
+                for prop_name, prop_schema in properties.items():
+                    if isinstance(prop_schema, dict):
+                        index.setdefault(prop_name, []).append(properties)
+                        if prop_schema.get("type") == "array" and "items" in prop_schema:
+                            stack.append(prop_schema["items"])
+                        elif prop_schema.get("type") == "object":
+                            stack.append(prop_schema)
+        return index
     
     def _convert_to_schema(self, value: Any, path: List[str]) -> Dict[str, Any]:
         """Convert any value to JSON Schema in a generic way"""
-        path_str = ".".join(path)
-        
-        # Handle dictionaries (objects)
-        if isinstance(value, dict):
-            # Special handling for type definitions
-            if "type" in value:
-                schema = self._convert_type_definition(value["type"], path)
-                # If the type parser tracked required fields, use them
-                if hasattr(self.type_parser, 'required_fields') and hasattr(self.type_parser, 'optional_fields'):
-                    if "properties" in schema and "required" not in schema:
-                        required_list = []
-                        for field_name in schema["properties"].keys():
-                            if field_name not in self.type_parser.optional_fields and field_name != "id":
-                                required_list.append(field_name)
-                        if required_list:
-                            schema["required"] = required_list
-                return schema
-            
-            # Generic object handling
-            schema = {
-                "type": "object",
-                "additionalProperties": True,
-                "properties": {},
-                "required": [],
-            }
-            
-            for key, val in value.items():
-                prop_path = path + [key]
-                prop_schema = self._convert_to_schema(val, prop_path)
-                schema["properties"][key] = prop_schema
-                schema["required"].append(key)
-            
-            # Add UUID selectively based on path and context
-            should_add_uuid = self.add_uuid_selectively and self._should_add_uuid(path, value)
-            if should_add_uuid:
-                self._add_id_field(schema)
-                self.uuid_added_paths.add(path_str)
-            
+        handler = self._VALUE_HANDLERS.get(type(value))
+        if handler is None:
+            # Subclasses of the handled types resolve in the original precedence order
+            for value_type, candidate in self._VALUE_HANDLERS.items():
+                if isinstance(value, value_type):
+                    handler = candidate
+                    break
+            else:
+                return {"type": "string"}  # Default fallback
+        return handler(self, value, path)
+    
+    def _convert_dict_to_schema(self, value: Dict[str, Any], path: List[str]) -> Dict[str, Any]:
+        """Convert a dictionary (object) value to JSON Schema"""
+        # Special handling for type definitions
+        if "type" in value:
+            schema = self._convert_type_definition(value["type"], path)
+            # If the type parser tracked required fields, use them
+            if hasattr(self.type_parser, 'required_fields') and hasattr(self.type_parser, 'optional_fields'):
+                if "properties" in schema and "required" not in schema:
+                    optional_fields = self.type_parser.optional_fields
+                    required_list = [
+                        field_name for field_name in schema["properties"]
+                        if field_name not in optional_fields and field_name != "id"
+                    ]
+                    if required_list:
+                        schema["required"] = required_list
             return schema
         
-        # Handle lists/arrays
-        elif isinstance(value, list):
-            if len(value) > 0:
-                # Assume homogeneous array
-                item_schema = self._convert_to_schema(value[0], path + ["item"])
-                # Add UUID to array items
-                if self.add_uuid_selectively:
-                    self._add_id_field(item_schema)
-                return {"type": "array", "items": item_schema}
-            else:
-                return {"type": "array", "items": {}}
-        
-        # Handle primitive types
-        elif isinstance(value, str):
-            return self._convert_string_to_schema(value, path)
-        elif isinstance(value, (int, float)):
-            return {"type": "number"}
-        elif isinstance(value, bool):
-            return {"type": "boolean"}
-        elif value is None:
-            return {}
+        # Generic object handling
+        schema = dict(_OBJECT_SCHEMA_TEMPLATE, properties={}, required=[])
+        
+        for key, val in value.items():
+            prop_path = path + [key]
+            prop_schema = self._convert_to_schema(val, prop_path)
+            schema["properties"][key] = prop_schema
+            schema["required"].append(key)
+        
+        # Add UUID selectively based on path and context
+        should_add_uuid = self.add_uuid_selectively and self._should_add_uuid(path, value)
+        if should_add_uuid:
+            self._add_id_field(schema)
+            self.uuid_added_paths.add(".".join(path))
+        
+        return schema
+    
+    def _convert_list_to_schema(self, value: List[Any], path: List[str]) -> Dict[str, Any]:
+        """Convert a list (array) value to JSON Schema"""
+        if len(value) > 0:
+            # Assume homogeneous array
+            item_schema = self._convert_to_schema(value[0], path + ["item"])
+            # Add UUID to array items
+            if self.add_uuid_selectively:
+                self._add_id_field(item_schema)
+            return {"type": "array", "items": item_schema}
         else:
-            return {"type": "string"}  # Default fallback
+            return {"type": "array", "items": {}}
+    
+    def _convert_number_to_schema(self, value: Union[int, float], path: List[str]) -> Dict[str, Any]:
+        """Convert a numeric value to JSON Schema"""
+        # bool is an int subclass and has always been reported as a number here
+        return {"type": "number"}
+    
+    def _convert_none_to_schema(self, value: None, path: List[str]) -> Dict[str, Any]:
+        """Convert a null value to JSON Schema"""
+        return {}
     
     def _convert_type_definition(self, type_def: Any, path: List[str]) -> Dict[str, Any]:
         """Convert Terraform type definition to JSON Schema"""
@@ -711,49 +891,65 @@ class GenericJSONSchemaGenerator:
         if value.lower() in ["true", "false"]:
             return {"type": "boolean"}
         
-        # Handle numeric strings
-        try:
-            if "." in value:
-                float(value)
-                return {"type": "number"}
-            else:
-                int(value)
-                return {"type": "integer"}
-        except ValueError:
-            pass
-        
-        # Handle array strings
-        if value.startswith("[") and value.endswith("]"):
+        # Handle numeric strings; only text that can start a Python number
+        # is tried, so ordinary strings never raise and catch a ValueError
+        first = value[:1]
+        if first in _LENIENT_NUMBER_START_CHARS or first.isdecimal():
+            try:
+                if "." in value:
+                    float(value)
+                    return {"type": "number"}
+                else:
+                    int(value)
+                    return {"type": "integer"}
+            except ValueError:
+                pass
+        
+        # Handle array and object strings by their (already stripped) delimiters
+        last = value[-1:]
+        if first == "[" and last == "]":
             return {"type": "array", "items": {}}
-        
-        # Handle object strings
-        if value.startswith("{") and value.endswith("}"):
+        if first == "{" and last == "}":
             return {"type": "object", "additionalProperties": True}
         
         # Default to string
         return {"type": "string"}
     
+    # Exact value type -> converter; insertion order is the isinstance
+    # precedence used for subclasses
+    _VALUE_HANDLERS = {
+        dict: _convert_dict_to_schema,
+        list: _convert_list_to_schema,
+        str: _convert_string_to_schema,
+        int: _convert_number_to_schema,
+        float: _convert_number_to_schema,
+        bool: _convert_number_to_schema,
+        type(None): _convert_none_to_schema,
+    }
+    
     def _should_add_uuid(self, path: List[str], value: Dict[str, Any]) -> bool:
         """Determine if UUID should be added at this path"""
         # Add UUID only to the first level of arrays (variable-level arrays)
         # Do not add UUID to nested arrays like ingress/egress within nacl
-        if len(path) > 0:
+        depth = len(path)
+        if depth > 0:
             # If the path ends with "item", it's likely an array element
             if path[-1] == "item":
                 # Only add UUID if this is a top-level array (path length is 2: [var_name, "item"])
-                return len(path) == 2
+                return depth == 2
             
             # If we're processing array items, add UUID only for top-level arrays
-            if len(path) >= 2 and path[-2] == "items":
+            if depth >= 2 and path[-2] == "items":
                 # Only add UUID if this is a top-level array (path length is 3: [var_name, "items", "item"])
-                return len(path) == 3
+                return depth == 3
         
         return False
     
     def _add_id_field(self, schema: Dict[str, Any]):
         """Add id field to the schema"""
-        if "properties" in schema and "id" not in schema["properties"]:
-            schema["properties"]["id"] = {
+        properties = schema.get("properties")
+        if properties is not None and "id" not in properties:
+            properties["id"] = {
                 "type": "string",
                 "format": "uuid",
                 "default": "",
@@ -761,71 +957,292 @@ class GenericJSONSchemaGenerator:
             }
 
 
+# Number of convert_directory progress lines buffered per stdout write
+_PROGRESS_BATCH_SIZE = 64
+
+# Default location of the on-disk conversion cache used by the command line
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "tfvars_to_json_schema")
+# Entries kept in the conversion cache; older ones are pruned after each run
+DEFAULT_CACHE_MAX_ENTRIES = 4096
+# Age after which a temporary cache file is taken to be left over by a killed writer
+_STALE_CACHE_TMP_NS = 3600 * 10**9
+
+
+def _hcl2_version() -> str:
+    """
+    Return hcl2.__version__ without importing hcl2 and its grammar
+    
+    hcl2 takes its version from the setuptools_scm generated hcl2/version.py,
+    which is loaded on its own here so cache hits stay free of the parser.
+    """
+    spec = importlib.util.find_spec("hcl2")
+    locations = spec.submodule_search_locations if spec else None
+    if not locations:
+        return "unknown"
+    version_spec = importlib.util.spec_from_file_location(
+        "_hcl2_version", os.path.join(locations[0], "version.py")
+    )
+    try:
+        version_module = importlib.util.module_from_spec(version_spec)
+        version_spec.loader.exec_module(version_module)
+        return str(version_module.version)
+    except (AttributeError, ImportError, OSError):
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def _converter_stamp() -> str:
+    """Identify this script's revision and python-hcl2 release so cached output is dropped when either changes"""
+    try:
+        st = os.stat(__file__)
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns}:{st.st_size}:{_hcl2_version()}"
+
+
+def _find_variables_files(root: str, file_name: str = "variables.tf") -> Iterator[str]:
+    """
+    Yield paths of every file_name below root, in the order Path.rglob would
+    
+    os.scandir reuses the directory entry type information, so walking a
+    large tree costs one getdents pass per directory instead of a stat per
+    entry. Symlinked directories are not descended into and unreadable
+    directories are skipped, like rglob.
+    
+    Args:
+        root: Directory to search
+        file_name: Exact file name to match
+        
+    Returns:
+        Iterator over matching file paths, each directory's own match first
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name == file_name and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        # Reversed so the first subdirectory is visited next (pre-order)
+        pending.extend(reversed(subdirs))
+
+
 class GenericTerraformToJSONSchemaConverter:
     """Truly generic converter using professional libraries"""
     
-    def __init__(self, add_uuid_selectively: bool = True):
+    def __init__(self, add_uuid_selectively: bool = True, cache_dir: Optional[str] = None,
+                 pretty: bool = True, cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
         """
         Initialize the converter
         
         Args:
             add_uuid_selectively: Add UUID only where semantically appropriate
+            cache_dir: Directory for cached conversions keyed by input path,
+                       mtime and size (optional, disabled when omitted)
+            pretty: Write schemas indented by 4 spaces rather than compact
+            cache_max_entries: Cache entries kept by prune_cache, which
+                               convert_directory runs when it finishes
         """
+        self.add_uuid_selectively = add_uuid_selectively
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.pretty = pretty
+        self.cache_max_entries = cache_max_entries
+        self._created_dirs = set()  # Output directories known to exist in this run
         self.parser = GenericTerraformParser()
         self.generator = GenericJSONSchemaGenerator(add_uuid_selectively)
     
-    def convert_file(self, input_file: str, output_file: Optional[str] = None) -> str:
+    def convert_file(self, input_file: str, output_file: Optional[str] = None,
+                     variables: Optional[Dict[str, Any]] = None) -> str:
         """
         Convert a single Terraform variables file to JSON Schema
         
         Args:
             input_file: Path to the Terraform variables file
             output_file: Path to the output JSON Schema file (optional)
+            variables: Variables already parsed from input_file (optional,
+                       avoids reading and parsing the file a second time)
             
         Returns:
             Path to the generated JSON Schema file
+            
+        Raises:
+            FileNotFoundError: If input_file does not exist
         """
-        # Validate input file
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file '{input_file}' does not exist")
+        cache_key = self._cache_key(input_file) if self.cache_dir else None
+        
+        # An unchanged input is served from the cache without parsing
+        if cache_key and variables is None:
+            cached = self._read_cache(cache_key)
+            if cached is not None:
+                output_filename, data = cached
+                output_path = Path(output_file) if output_file else Path(input_file).parent / output_filename
+                with open(output_path, "wb") as f:
+                    f.write(data)
+                return str(output_path)
         
         # Parse Terraform variables to get variable names
-        variables = self.parser.parse_file(input_file)
+        if variables is None:
+            variables = self.parser.parse_file(input_file)
+        
+        # Use the first variable name as the filename, or fallback to "variables"
+        if variables:
+            # Get the first variable name
+            var_name = next(iter(variables))
+            output_filename = f"{var_name}.json"
+        else:
+            output_filename = "variables.json"
         
         # Determine output file
         if output_file:
             output_path = Path(output_file)
         else:
-            input_path = Path(input_file)
-            # Use the first variable name as the filename, or fallback to "variables"
-            if variables:
-                # Get the first variable name
-                var_name = next(iter(variables.keys()))
-                output_filename = f"{var_name}.json"
-            else:
-                output_filename = "variables.json"
-            output_path = input_path.parent / output_filename
+            output_path = Path(input_file).parent / output_filename
         
         # Generate JSON Schema
         schema = self.generator.generate_schema(variables)
         
-        # Write output
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(schema, f, indent=4, ensure_ascii=False)
+        # Serialize once and write the whole buffer in a single call
+        data = _dumps_schema(schema, self.pretty)
+        with open(output_path, "wb") as f:
+            f.write(data)
+        
+        if cache_key:
+            self._write_cache(cache_key, output_filename, data)
         
         return str(output_path)
     
-    def convert_directory(self, input_dir: str, output_dir: Optional[str] = None) -> List[str]:
+    def _cache_key(self, input_file: str) -> Optional[str]:
+        """
+        Build the cache key for an input file
+        
+        Returns:
+            Hex digest of the file's identity and the converter settings, or
+            None if the file can't be stat'ed (parsing reports the error)
+        """
+        try:
+            st = os.stat(input_file)
+        except OSError:
+            return None
+        identity = (
+            f"{os.path.abspath(input_file)}:{st.st_mtime_ns}:{st.st_size}:"
+            f"{self.add_uuid_selectively}:{self.pretty}:{_converter_stamp()}"
+        )
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=20).hexdigest()
+    
+    def _read_cache(self, cache_key: str) -> Optional[Tuple[str, bytes]]:
+        """Return the cached (default output filename, schema bytes), or None on a miss"""
+        entry_path = os.path.join(self.cache_dir, cache_key)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = f.read()
+        except OSError:
+            return None
+        # A hit refreshes the entry's mtime, which prune_cache evicts by
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        # Entries are the default output filename, a newline, then the schema
+        output_filename, sep, data = entry.partition(b"\n")
+        if not sep:
+            return None
+        return output_filename.decode("utf-8"), data
+    
+    def _write_cache(self, cache_key: str, output_filename: str, data: bytes) -> None:
+        """Store a conversion result; the cache is best effort, so failures are ignored"""
+        entry_path = os.path.join(self.cache_dir, cache_key)
+        # Unique temporary name so concurrent workers never share a partial file
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(output_filename.encode("utf-8") + b"\n")
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def prune_cache(self) -> int:
+        """
+        Remove the least recently used cache entries beyond cache_max_entries
+        
+        Pruning runs once per conversion run rather than on every write, so
+        the directory can briefly hold one run's worth of extra entries.
+        Temporary files of _write_cache don't count as entries; those older
+        than an hour were left by a killed writer and are deleted.
+        
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir:
+            return 0
+        files = []
+        tmp_files = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        (tmp_files if entry.name.endswith(".tmp") else files).append(entry)
+        except OSError:
+            return 0
+        
+        stale_before = time.time_ns() - _STALE_CACHE_TMP_NS
+        for entry in tmp_files:
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime_ns < stale_before:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+        
+        excess = len(files) - self.cache_max_entries
+        if excess <= 0:
+            return 0
+        
+        by_age = []
+        for entry in files:
+            try:
+                by_age.append((entry.stat(follow_symlinks=False).st_mtime_ns, entry.path))
+            except OSError:
+                excess -= 1  # Removed concurrently
+        by_age.sort()
+        removed = 0
+        for _, path in by_age[:max(excess, 0)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+    
+    def convert_directory(self, input_dir: str, output_dir: Optional[str] = None,
+                          jobs: Optional[int] = None, incremental: bool = False) -> List[str]:
         """
         Convert all Terraform variables files in a directory to JSON Schema
         
         Args:
             input_dir: Path to the directory containing Terraform files
             output_dir: Path to the output directory (optional, defaults to input_dir)
+            jobs: Number of worker processes (optional, defaults to the CPU count;
+                  1 converts in this process)
+            incremental: Skip files whose output is at least as new as the input
             
         Returns:
             List of paths to the generated JSON Schema files
+            
+        Raises:
+            ValueError: If input_dir is not a directory or jobs is less than 1
         """
+        if jobs is not None and jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {jobs}")
         input_path = Path(input_dir)
         if not input_path.exists() or not input_path.is_dir():
             raise ValueError(f"Input directory '{input_dir}' does not exist or is not a directory")
@@ -836,31 +1253,144 @@ class GenericTerraformToJSONSchemaConverter:
             output_path.mkdir(parents=True, exist_ok=True)
         else:
             output_path = input_path
+        self._created_dirs = set()
         
-        # Find all variables.tf files
-        var_files = list(input_path.rglob("variables.tf"))
+        # Find all variables.tf files; the walker joins entry names onto the
+        # input string, so every path starts with the same prefix
+        input_str = str(input_path)
+        var_files = list(_find_variables_files(input_str))
         if not var_files:
             print(f"No variables.tf files found in directory '{input_dir}'")
             return []
         
-        generated_files = []
+        # Output paths mirror the input tree; plain string slicing avoids
+        # building PurePath objects for every file
+        prefix_len = len(input_str if input_str.endswith(os.sep) else input_str + os.sep)
+        output_str = str(output_path)
+        plan = []
         for var_file in var_files:
-            try:
-                # Determine output file path
-                relative_path = var_file.relative_to(input_path)
-                output_file = output_path / relative_path.with_suffix(".json")
-                
-                # Create output directory if needed
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Convert file
-                result = self.convert_file(str(var_file), str(output_file))
-                generated_files.append(result)
-                print(f"Converted '{var_file}' to '{result}'")
-            except Exception as e:
-                print(f"Error converting '{var_file}': {str(e)}")
+            # Determine output file path: <output>/<relative dir>/variables.json
+            relative_path = var_file[prefix_len:]
+            output_file = relative_path[:-len(".tf")] + ".json"
+            # Like pathlib, drop a leading "./" when a side is the current directory
+            if output_str != os.curdir:
+                output_file = os.path.join(output_str, output_file)
+            if input_str == os.curdir:
+                var_file = relative_path
+            up_to_date = incremental and self._is_up_to_date(var_file, output_file)
+            plan.append((var_file, output_file, up_to_date))
+        
+        # Only stale files are dispatched; up-to-date ones are reported in place
+        tasks = [(var_file, output_file) for var_file, output_file, up_to_date in plan if not up_to_date]
+        
+        # Parsing is CPU-bound, so fan out across processes to sidestep the GIL;
+        # a single file is converted in-process to skip the pool start-up cost
+        executor = None
+        if jobs == 1 or len(tasks) <= 1:
+            results = map(self._convert_task, tasks)
+        else:
+            # Imported here so single-file runs don't pay for the
+            # multiprocessing machinery at startup
+            from concurrent.futures import ProcessPoolExecutor
+            
+            # Settings travel once per worker through the initializer, so
+            # tasks are just (input, output) path pairs
+            executor = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_convert_worker,
+                initargs=(self._settings(),),
+            )
+            # Hand tasks out in batches to amortize IPC on large trees, while
+            # keeping about four batches per worker for load balancing
+            workers = jobs or os.cpu_count() or 1
+            chunksize = max(1, len(tasks) // (workers * 4))
+            results = executor.map(_convert_file_worker, tasks, chunksize=chunksize)
         
+        generated_files = []
+        # Progress lines are written in batches rather than one print per file
+        messages = []
+        try:
+            # Results arrive in input order, so the log matches a sequential run
+            results = iter(results)
+            for var_file, output_file, up_to_date in plan:
+                if up_to_date:
+                    generated_files.append(output_file)
+                    messages.append(f"Skipped '{var_file}': '{output_file}' is up to date")
+                else:
+                    result, error = next(results)
+                    if error is None:
+                        generated_files.append(result)
+                        messages.append(f"Converted '{var_file}' to '{result}'")
+                    else:
+                        messages.append(f"Error converting '{var_file}': {error}")
+                if len(messages) >= _PROGRESS_BATCH_SIZE:
+                    sys.stdout.write("\n".join(messages) + "\n")
+                    messages.clear()
+        finally:
+            if messages:
+                sys.stdout.write("\n".join(messages) + "\n")
+            if executor is not None:
+                executor.shutdown()
+        
+        self.prune_cache()
         return generated_files
+    
+    def _is_up_to_date(self, input_file: str, output_file: str) -> bool:
+        """Check whether output_file exists and was modified no earlier than input_file"""
+        try:
+            return os.stat(output_file).st_mtime_ns >= os.stat(input_file).st_mtime_ns
+        except OSError:
+            return False
+    
+    def _settings(self) -> Tuple[bool, Optional[str], bool, int]:
+        """Constructor arguments that recreate this converter in a worker process"""
+        return (self.add_uuid_selectively, self.cache_dir, self.pretty, self.cache_max_entries)
+    
+    def _convert_task(self, task: Tuple[str, str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Convert one (input_file, output_file) task
+        
+        Returns:
+            (generated file path, None) on success, or (None, error message) on failure
+        """
+        input_file, output_file = task
+        try:
+            # Create output directory if needed, once per directory per process;
+            # a failure isn't remembered, so every file in it reports the error
+            output_parent = os.path.dirname(output_file)
+            if output_parent not in self._created_dirs:
+                if output_parent:
+                    os.makedirs(output_parent, exist_ok=True)
+                self._created_dirs.add(output_parent)
+            return self.convert_file(input_file, output_file), None
+        except Exception as e:
+            return None, str(e)
+
+
+# Converter used by every task of a process pool worker, set by _init_convert_worker
+_worker_converter: Optional[GenericTerraformToJSONSchemaConverter] = None
+
+
+def _init_convert_worker(settings: Tuple[bool, Optional[str], bool, int]) -> None:
+    """Process pool initializer: build the worker's converter once, before any task"""
+    global _worker_converter
+    _worker_converter = GenericTerraformToJSONSchemaConverter(*settings)
+
+
+def _convert_file_worker(task: Tuple[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Process pool entry point: convert one file with this process's converter"""
+    return _worker_converter._convert_task(task)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -879,7 +1409,12 @@ def main():
     parser.add_argument(
         "--pretty", 
         action="store_true", 
-        help="Pretty print JSON output (always enabled in this version)"
+        help="Pretty print JSON output (the default, see --compact)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write compact JSON without indentation or spaces"
     )
     parser.add_argument(
         "--debug", 
@@ -891,30 +1426,62 @@ def main():
         action="store_true", 
         help="Disable selective UUID field addition"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        help="Worker processes for directory conversion (default: CPU count, 1 disables parallelism)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="In directory mode, skip files whose output is newer than the input"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached conversions of unchanged inputs (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=_positive_int,
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        help=f"Cached conversions kept, least recently used pruned first (default: {DEFAULT_CACHE_MAX_ENTRIES})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk conversion cache"
+    )
     
     args = parser.parse_args()
     
     try:
-        converter = GenericTerraformToJSONSchemaConverter(not args.no_uuid)
+        converter = GenericTerraformToJSONSchemaConverter(
+            not args.no_uuid, None if args.no_cache else args.cache_dir, not args.compact,
+            args.cache_max_entries
+        )
         
         # Check if input is a directory or file
         input_path = Path(args.input)
         if input_path.is_dir():
             # Process directory
-            generated_files = converter.convert_directory(str(input_path), args.output)
+            generated_files = converter.convert_directory(str(input_path), args.output, args.jobs, args.incremental)
             if generated_files:
                 print(f"Successfully converted {len(generated_files)} files")
             else:
                 print("No files were converted")
         else:
-            # Process single file
-            if not input_path.exists():
-                print(f"Error: Input file '{args.input}' does not exist")
-                return 1
-                
+            # Process single file; a missing file is reported by the first read
+            # instead of a separate exists() check
+            variables = None
+            
             # Parse and debug if needed
             if args.debug:
-                variables = converter.parser.parse_file(str(input_path))
+                try:
+                    variables = converter.parser.parse_file(str(input_path))
+                except FileNotFoundError:
+                    print(f"Error: Input file '{args.input}' does not exist")
+                    return 1
                 print("=== Debug: Parsed Variables ===")
                 for var_name, var_def in variables.items():
                     print(f"\n{var_name}:")
@@ -924,7 +1491,8 @@ def main():
                         else:
                             print(f"  {key}: {value}")
                 
-            output_file = converter.convert_file(str(input_path), args.output)
+            output_file = converter.convert_file(str(input_path), args.output, variables)
+            converter.prune_cache()
             print(f"Successfully generated JSON Schema: {output_file}")
             
         return 0
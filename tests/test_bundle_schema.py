@@ -0,0 +1,399 @@
+"""
+Tests for the $ref resolver in schemas/bundle_schema.py
+
+Run with: python -m pytest tests/ (or python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "schemas"))
+
+import bundle_schema  # noqa: E402
+from bundle_schema import SchemaBundler  # noqa: E402
+
+
+def _json_backends():
+    """(name, orjson, ijson) combinations selecting each load_schema code path"""
+    backends = [("json", None, None)]
+    if bundle_schema.ijson is not None:
+        backends.append(("ijson", None, bundle_schema.ijson))
+    if bundle_schema.orjson is not None:
+        backends.append(("orjson", bundle_schema.orjson, None))
+    return backends
+
+
+class BundlerTestCase(unittest.TestCase):
+    """Base class providing a temporary directory of schema documents"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, relative_path, document):
+        """Write a JSON document below the base directory and return its path"""
+        path = self.base / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document), encoding="utf-8")
+        return path
+
+    def resolve(self, schema):
+        """Resolve a root schema against the base directory"""
+        return SchemaBundler(str(self.base)).resolve_schema(schema)
+
+
+class TestReferenceResolution(BundlerTestCase):
+    """$ref resolution, which replaced jsonref.loads(..., jsonschema=True)"""
+
+    def test_local_and_external_refs(self):
+        self.write("defs/common.json", {
+            "definitions": {
+                "name": {"type": "string"},
+                "tags": {"type": "array", "items": {"$ref": "#/definitions/name"}},
+            }
+        })
+        schema = {
+            "definitions": {"port": {"type": "integer"}},
+            "properties": {
+                "port": {"$ref": "#/definitions/port"},
+                "tags": {"$ref": "defs/common.json#/definitions/tags"},
+            },
+        }
+
+        resolved = self.resolve(schema)
+
+        self.assertEqual(resolved["properties"]["port"], {"type": "integer"})
+        self.assertEqual(
+            resolved["properties"]["tags"],
+            {"type": "array", "items": {"type": "string"}},
+        )
+        # The input schema is left untouched
+        self.assertEqual(schema["properties"]["port"], {"$ref": "#/definitions/port"})
+
+    def test_id_changes_base_uri_of_nested_refs(self):
+        self.write("other.json", {"definitions": {"v": {"type": "integer"}}})
+        self.write("sub/other.json", {"definitions": {"v": {"type": "string"}}})
+        schema = {
+            "properties": {
+                "scoped": {
+                    "$id": "sub/",
+                    "properties": {"x": {"$ref": "other.json#/definitions/v"}},
+                },
+                "unscoped": {"$ref": "other.json#/definitions/v"},
+            }
+        }
+
+        resolved = self.resolve(schema)
+
+        self.assertEqual(
+            resolved["properties"]["scoped"]["properties"]["x"], {"type": "string"}
+        )
+        self.assertEqual(resolved["properties"]["unscoped"], {"type": "integer"})
+
+    def test_fragment_ref_inside_id_scope_targets_identified_subschema(self):
+        schema = {
+            "definitions": {"w": {"type": "integer"}},
+            "properties": {
+                "scoped": {
+                    "$id": "sub/",
+                    "definitions": {"w": {"type": "boolean"}},
+                    "properties": {"y": {"$ref": "#/definitions/w"}},
+                },
+                "by_id": {"$ref": "sub/#/definitions/w"},
+                "root": {"$ref": "#/definitions/w"},
+            },
+        }
+
+        properties = self.resolve(schema)["properties"]
+
+        self.assertEqual(properties["scoped"]["properties"]["y"], {"type": "boolean"})
+        self.assertEqual(properties["by_id"], {"type": "boolean"})
+        self.assertEqual(properties["root"], {"type": "integer"})
+
+    def test_recursive_ref_in_root_stays_local(self):
+        schema = {
+            "definitions": {
+                "node": {
+                    "type": "object",
+                    "properties": {"children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+                }
+            },
+            "properties": {"tree": {"$ref": "#/definitions/node"}},
+        }
+
+        resolved = self.resolve(schema)
+
+        children = resolved["properties"]["tree"]["properties"]["children"]
+        self.assertEqual(children["items"], {"$ref": "#/definitions/node"})
+
+    def test_recursive_ref_in_external_document_is_made_absolute(self):
+        tree_path = self.write("tree.json", {
+            "definitions": {
+                "node": {
+                    "type": "object",
+                    "properties": {"children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+                }
+            }
+        })
+        schema = {"properties": {"tree": {"$ref": "tree.json#/definitions/node"}}}
+
+        resolved = self.resolve(schema)
+
+        # A relative "#/definitions/node" would point into the bundle, which has none
+        children = resolved["properties"]["tree"]["properties"]["children"]
+        self.assertEqual(
+            children["items"],
+            {"$ref": f"{Path(tree_path).absolute().as_uri()}#/definitions/node"},
+        )
+
+    def test_unreached_remote_refs_are_not_fetched(self):
+        self.write("common.json", {
+            "definitions": {
+                "a": {"type": "string"},
+                "b": {"$ref": "http://127.0.0.1:8765/unused.json"},
+            }
+        })
+        self.write("other.json", {"definitions": {"c": {"type": "integer"}}})
+        schema = {
+            "properties": {
+                "a": {"$ref": "common.json#/definitions/a"},
+                "c": {"$ref": "other.json#/definitions/c"},
+            }
+        }
+
+        with mock.patch.object(bundle_schema, "urlopen") as urlopen:
+            resolved = self.resolve(schema)
+
+        urlopen.assert_not_called()
+        self.assertEqual(
+            resolved["properties"], {"a": {"type": "string"}, "c": {"type": "integer"}}
+        )
+
+    def test_two_node_cycle_does_not_depend_on_property_order(self):
+        definitions = {
+            "a": {"$ref": "#/definitions/b"},
+            "b": {"properties": {"next": {"$ref": "#/definitions/a"}}},
+        }
+        q = {"$ref": "#/definitions/a"}
+        p = {"$ref": "#/definitions/b"}
+
+        for properties in ({"q": q, "p": p}, {"p": p, "q": q}):
+            with self.subTest(order=list(properties)):
+                resolved = self.resolve({"definitions": definitions, "properties": properties})
+
+                self.assertEqual(
+                    resolved["properties"]["q"],
+                    {"properties": {"next": {"$ref": "#/definitions/a"}}},
+                )
+                self.assertEqual(
+                    resolved["properties"]["p"],
+                    {"properties": {"next": {"$ref": "#/definitions/b"}}},
+                )
+
+
+class TestLoadSchema(BundlerTestCase):
+    """Parsing of schema files with each available JSON backend"""
+
+    def load_with_each_backend(self, relative_path, content):
+        """Yield (backend name, load callable) for a file holding raw content"""
+        path = self.base / relative_path
+        path.write_bytes(content)
+        for name, orjson_module, ijson_module in _json_backends():
+            with mock.patch.object(bundle_schema, "orjson", orjson_module), \
+                    mock.patch.object(bundle_schema, "ijson", ijson_module):
+                yield name, lambda: SchemaBundler(str(self.base)).load_schema(path)
+
+    def test_valid_document(self):
+        for name, load in self.load_with_each_backend("ok.json", b'{"a": [1, 2.5]}\n'):
+            with self.subTest(backend=name):
+                self.assertEqual(load(), {"a": [1, 2.5]})
+
+    def test_trailing_data_is_rejected(self):
+        for content in (b'{"a": 1} x', b'{"a": 1} {"b": 2}', b""):
+            for name, load in self.load_with_each_backend("bad.json", content):
+                with self.subTest(backend=name, content=content):
+                    with self.assertRaises(json.JSONDecodeError):
+                        load()
+
+
+class TestPropertyTransforms(BundlerTestCase):
+    """Where bundling marks properties required and flattens them"""
+
+    def transform(self, schema):
+        bundler = SchemaBundler(str(self.base))
+        return bundler._walk_and_transform(schema, flatten=True, set_required=True)
+
+    def test_nested_subschemas_are_transformed(self):
+        node = {"type": "object", "properties": {"a": {"type": "string"}}}
+        schema = {
+            "properties": {"p": dict(node)},
+            "items": dict(node),
+            "allOf": [dict(node)],
+            "anyOf": [dict(node)],
+            "oneOf": [dict(node)],
+            "definitions": {"d": dict(node)},
+            "$defs": {"d": dict(node)},
+        }
+
+        result = self.transform(schema)
+
+        for subschema in (
+            result["properties"]["p"], result["items"], result["allOf"][0],
+            result["anyOf"][0], result["oneOf"][0], result["definitions"]["d"],
+            result["$defs"]["d"],
+        ):
+            self.assertEqual(subschema["required"], ["a"])
+
+    def test_other_keywords_are_left_untransformed(self):
+        node = {"type": "object", "properties": {"a": {"type": "string"}}}
+        definitions = {"node": node}
+        schema = {
+            "definitions": definitions,
+            "not": {"$ref": "#/definitions/node"},
+            "if": dict(node),
+            "then": dict(node),
+            "else": dict(node),
+            "contains": dict(node),
+            "propertyNames": dict(node),
+            "additionalProperties": dict(node),
+            "options": {"layout": dict(node)},
+            "default": dict(node),
+        }
+
+        result = self.transform(schema)
+
+        self.assertEqual(result["definitions"]["node"]["required"], ["a"])
+        # Resolved, but not given a required list
+        self.assertEqual(result["not"], node)
+        for keyword in ("if", "then", "else", "contains", "propertyNames",
+                        "additionalProperties", "default"):
+            self.assertEqual(result[keyword], node, keyword)
+        self.assertEqual(result["options"], {"layout": node})
+
+
+class TestBundleNumbers(BundlerTestCase):
+    """Numbers orjson cannot represent must be bundled exactly as written"""
+
+    def test_big_integers_and_non_finite_numbers_are_preserved(self):
+        content = (
+            '{"properties": {"n": {"type": "integer", '
+            '"maximum": 12345678901234567890123, "minimum": -9223372036854775809, '
+            '"default": NaN, "multipleOf": 1e400, "exclusiveMaximum": -Infinity}}}'
+        )
+        (self.base / "numbers.json").write_text(content, encoding="utf-8")
+        expected = json.loads(content)["properties"]["n"]
+
+        for name, orjson_module, ijson_module in _json_backends():
+            with self.subTest(backend=name), \
+                    mock.patch.object(bundle_schema, "orjson", orjson_module), \
+                    mock.patch.object(bundle_schema, "ijson", ijson_module):
+                output = self.base / f"numbers_{name}.json"
+                with contextlib.redirect_stdout(io.StringIO()):
+                    SchemaBundler(str(self.base)).bundle_schema(
+                        self.base / "numbers.json", output, use_cache=False
+                    )
+
+                bundled = json.loads(output.read_text(encoding="utf-8"))["properties"]["n"]
+                # Compared as text, since NaN never equals itself
+                self.assertEqual(json.dumps(bundled), json.dumps(expected))
+
+    def test_small_floats_are_written_like_json(self):
+        schema = {"properties": {"n": {"type": "number", "minimum": 1e-07,
+                                       "maximum": 5e-05, "multipleOf": 0.5}}}
+        (self.base / "floats.json").write_text(json.dumps(schema), encoding="utf-8")
+        output = self.base / "floats_out.json"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            SchemaBundler(str(self.base)).bundle_schema(
+                self.base / "floats.json", output, use_cache=False
+            )
+
+        self.assertEqual(
+            output.read_text(encoding="utf-8"),
+            json.dumps({**schema, "required": ["n"]}, indent=2),
+        )
+
+
+class TestBundleOutput(BundlerTestCase):
+    """Writing of the bundled output file"""
+
+    def test_concurrent_bundles_of_one_output_do_not_collide(self):
+        properties = {f"p{index}": {"type": "string"} for index in range(2000)}
+        root = self.write("root.json", {"properties": properties})
+        output = self.base / "out" / "bundle.json"
+        errors = []
+
+        def bundle():
+            try:
+                for _ in range(5):
+                    SchemaBundler(str(self.base)).bundle_schema(root, output, use_cache=False)
+            except Exception as e:
+                errors.append(e)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            threads = [threading.Thread(target=bundle) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(output.parent), ["bundle.json"])
+        self.assertEqual(json.loads(output.read_text(encoding="utf-8"))["properties"], properties)
+
+
+class TestBundleCache(BundlerTestCase):
+    """The per-process cache used by bundle_schema(use_cache=True)"""
+
+    def bundle(self, input_path):
+        """Bundle input_path through the cache and return the parsed output"""
+        output = self.base / "out.json"
+        with contextlib.redirect_stdout(io.StringIO()):
+            SchemaBundler(str(self.base)).bundle_schema(input_path, output)
+        return json.loads(output.read_text(encoding="utf-8"))
+
+    def touch(self, path, offset_seconds):
+        """Give path a distinct modification time, independent of timestamp granularity"""
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset_seconds * 10**9))
+
+    def test_edited_referenced_document_is_picked_up(self):
+        other = self.write("other.json", {"definitions": {"v": {"type": "integer"}}})
+        root = self.write("root.json", {"properties": {"v": {"$ref": "other.json#/definitions/v"}}})
+        self.assertEqual(self.bundle(root)["properties"]["v"], {"type": "integer"})
+
+        self.write("other.json", {"definitions": {"v": {"type": "string"}}})
+        self.touch(other, 10)
+
+        self.assertEqual(self.bundle(root)["properties"]["v"], {"type": "string"})
+
+    def test_edited_root_document_is_picked_up(self):
+        root = self.write("root.json", {"properties": {"a": {"type": "integer"}}})
+        self.assertEqual(self.bundle(root)["required"], ["a"])
+
+        self.write("root.json", {"properties": {"b": {"type": "integer"}}})
+        self.touch(root, 10)
+
+        self.assertEqual(self.bundle(root)["required"], ["b"])
+
+    def test_unchanged_documents_are_served_from_the_cache(self):
+        self.write("other.json", {"definitions": {"v": {"type": "integer"}}})
+        root = self.write("root.json", {"properties": {"v": {"$ref": "other.json#/definitions/v"}}})
+        self.bundle(root)
+
+        with mock.patch.object(SchemaBundler, "_walk_and_transform") as walk:
+            self.assertEqual(self.bundle(root)["properties"]["v"], {"type": "integer"})
+        walk.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for scripts/terraform_to_json_schema.py
+
+Run with: python -m pytest tests/ (or python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import terraform_to_json_schema  # noqa: E402
+from terraform_to_json_schema import (  # noqa: E402
+    GenericTerraformToJSONSchemaConverter,
+    TerraformTypeParser,
+)
+
+
+class TestDefaultValues(unittest.TestCase):
+    """Parsing of optional(type, default) default values"""
+
+    def setUp(self):
+        self.parser = TerraformTypeParser()
+
+    def test_numbers(self):
+        for text, expected in (("8080", 8080), ("-3", -3), ("2.5", 2.5), ("1e5", 1e5),
+                               ("+4", 4), (".5", 0.5)):
+            with self.subTest(text=text):
+                self.assertEqual(self.parser._parse_default_value(text), expected)
+
+    def test_non_finite_numbers_stay_strings(self):
+        # These have no JSON representation and must not become inf/nan
+        for text in ("-Infinity", "Infinity", "NaN", "1e400", "-1e400", "1.5e400"):
+            with self.subTest(text=text):
+                value = self.parser._parse_default_value(text)
+                self.assertEqual(value, text)
+                json.dumps(value, allow_nan=False)
+
+
+class TestSerialization(unittest.TestCase):
+    """Schema output must match the json module byte for byte"""
+
+    def test_small_floats_match_json(self):
+        values = (1e-07, 1e-05, 9.5e-05, 1e-04, 1e-300, 1e+16, 2.5)
+        schema = {"properties": {
+            f"x{index}": {"type": "number", "default": value} for index, value in enumerate(values)
+        }}
+
+        self.assertEqual(
+            terraform_to_json_schema._dumps_schema(schema),
+            json.dumps(schema, indent=4, ensure_ascii=False).encode("utf-8"),
+        )
+        self.assertEqual(
+            terraform_to_json_schema._dumps_schema(schema, pretty=False),
+            json.dumps(schema, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        )
+
+
+class TestJobs(unittest.TestCase):
+    """Validation of the worker process count"""
+
+    def test_cli_rejects_counts_below_one(self):
+        for value in ("0", "-2"):
+            with self.subTest(jobs=value):
+                argv = ["terraform_to_json_schema.py", "variables.tf", "-j", value]
+                stderr = io.StringIO()
+                with mock.patch.object(sys, "argv", argv), contextlib.redirect_stderr(stderr):
+                    with self.assertRaises(SystemExit) as raised:
+                        terraform_to_json_schema.main()
+                self.assertEqual(raised.exception.code, 2)
+                self.assertIn("must be at least 1", stderr.getvalue())
+
+    def test_convert_directory_rejects_counts_below_one(self):
+        converter = GenericTerraformToJSONSchemaConverter(cache_dir=None)
+        with tempfile.TemporaryDirectory() as input_dir:
+            with self.assertRaises(ValueError):
+                converter.convert_directory(input_dir, jobs=0)
+
+
+class TestConversionCache(unittest.TestCase):
+    """The on-disk cache of conversion results"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = self.base / "cache"
+
+    def converter(self, cache_max_entries=2):
+        return GenericTerraformToJSONSchemaConverter(
+            cache_dir=str(self.cache_dir), cache_max_entries=cache_max_entries
+        )
+
+    def write_cache_entries(self, count):
+        """Create count entries with increasing modification times"""
+        self.cache_dir.mkdir()
+        for index in range(count):
+            path = self.cache_dir / f"entry{index}"
+            path.write_bytes(b"variables.json\n{}")
+            os.utime(path, ns=(0, (index + 1) * 10**9))
+
+    def test_key_depends_on_hcl2_version(self):
+        input_file = self.base / "variables.tf"
+        input_file.write_text('variable "a" {}\n', encoding="utf-8")
+        converter = self.converter()
+
+        with mock.patch.object(terraform_to_json_schema, "_hcl2_version", return_value="1.0.0"):
+            terraform_to_json_schema._converter_stamp.cache_clear()
+            old_key = converter._cache_key(str(input_file))
+        with mock.patch.object(terraform_to_json_schema, "_hcl2_version", return_value="2.0.0"):
+            terraform_to_json_schema._converter_stamp.cache_clear()
+            new_key = converter._cache_key(str(input_file))
+        terraform_to_json_schema._converter_stamp.cache_clear()
+
+        self.assertNotEqual(old_key, new_key)
+
+    def test_prune_keeps_most_recently_used_entries(self):
+        self.write_cache_entries(5)
+        converter = self.converter()
+        # A hit makes the oldest entry the most recently used one
+        self.assertIsNotNone(converter._read_cache("entry0"))
+
+        self.assertEqual(converter.prune_cache(), 3)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["entry0", "entry4"])
+
+    def test_prune_ignores_temporary_files(self):
+        self.write_cache_entries(2)
+        fresh = self.cache_dir / "entry1.123.tmp"
+        stale = self.cache_dir / "entry0.456.tmp"
+        for path in (fresh, stale):
+            path.write_bytes(b"variables.json\n")
+        os.utime(stale, ns=(0, 0))
+
+        self.assertEqual(self.converter().prune_cache(), 0)
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir)), ["entry0", "entry1", "entry1.123.tmp"]
+        )
+
+    def test_prune_within_limit_removes_nothing(self):
+        self.write_cache_entries(2)
+
+        self.assertEqual(self.converter().prune_cache(), 0)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()